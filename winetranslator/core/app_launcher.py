@@ -23,18 +23,21 @@ class AppLauncher:
         """
         self.db = db
 
-    def launch(self, app_id: int) -> tuple[bool, str, Optional[subprocess.Popen]]:
+    def launch(self, app_id: int,
+               app: Optional[Dict[str, any]] = None) -> tuple[bool, str, Optional[subprocess.Popen]]:
         """
         Launch an application.
 
         Args:
             app_id: ID of the application to launch.
+            app: Application row if the caller already has it.
 
         Returns:
             Tuple of (success, message, process)
         """
         # Get application details
-        app = self.db.get_application(app_id)
+        if app is None:
+            app = self.db.get_application(app_id)
         if not app:
             return False, "Application not found", None
 
@@ -154,17 +157,20 @@ class AppLauncher:
             logger.error(f"Exception in add_application: {str(e)}", exc_info=True)
             return False, f"Failed to add application: {str(e)}", None
 
-    def remove_application(self, app_id: int) -> tuple[bool, str]:
+    def remove_application(self, app_id: int,
+                           app: Optional[Dict[str, any]] = None) -> tuple[bool, str]:
         """
         Remove an application from the library.
 
         Args:
             app_id: ID of the application to remove.
+            app: Application row if the caller already has it.
 
         Returns:
             Tuple of (success, message)
         """
-        app = self.db.get_application(app_id)
+        if app is None:
+            app = self.db.get_application(app_id)
         if not app:
             return False, "Application not found"
 
@@ -187,7 +187,7 @@ class DependencyManager:
 
         try:
             cmd = [self.winetricks_path, '-q', dependency]
-            logger.debug(f"Running winetricks command: {' '.join(cmd)}")
+            logger.debug("Running winetricks command: %s", ' '.join(cmd))
             result = subprocess.run(
                 cmd,
                 env=env,
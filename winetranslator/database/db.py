@@ -33,8 +33,20 @@ class Database:
         # check_same_thread=False is safe here as we're using SQLite's built-in thread safety
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+
+        # WAL lets the launcher process read while the GUI writes, and with
+        # synchronous=NORMAL a commit no longer waits for an fsync
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+        """)
         self._create_tables()
 
+        # Settings table mirrored in memory (loaded on first read)
+        self._settings_cache: Optional[Dict[str, str]] = None
+
     def _create_tables(self):
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -226,12 +238,14 @@ class Database:
         return cursor.lastrowid
 
     def get_applications(self) -> List[Dict[str, Any]]:
-        """Get all applications."""
+        """Get all applications (same columns as get_application)."""
         cursor = self.conn.cursor()
         cursor.execute("""
-            SELECT a.*, p.name as prefix_name, p.path as prefix_path
+            SELECT a.*, p.name as prefix_name, p.path as prefix_path,
+                   r.path as runner_path, r.name as runner_name
             FROM applications a
             LEFT JOIN prefixes p ON a.prefix_id = p.id
+            LEFT JOIN runners r ON p.runner_id = r.id
             ORDER BY a.name ASC
         """)
         return [dict(row) for row in cursor.fetchall()]
@@ -330,6 +344,16 @@ class Database:
         """, (app_id, key, value))
         self.conn.commit()
 
+    def set_env_vars(self, app_id: int, env_vars: Dict[str, str]):
+        """Set several environment variables for an application in one transaction."""
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT INTO env_variables (app_id, key, value)
+            VALUES (?, ?, ?)
+            ON CONFLICT(app_id, key) DO UPDATE SET value = excluded.value
+        """, [(app_id, key, value) for key, value in env_vars.items()])
+        self.conn.commit()
+
     def get_env_vars(self, app_id: int) -> Dict[str, str]:
         """Get all environment variables for an application."""
         cursor = self.conn.cursor()
@@ -365,6 +389,16 @@ class Database:
         """, (app_id, dependency, 1 if auto_detected else 0))
         self.conn.commit()
 
+    def add_app_dependencies(self, app_id: int, dependencies: List[str], auto_detected: bool = True):
+        """Add several dependency profiles for an application in a single transaction."""
+        flag = 1 if auto_detected else 0
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT OR IGNORE INTO app_dependencies (app_id, dependency, auto_detected)
+            VALUES (?, ?, ?)
+        """, [(app_id, dependency, flag) for dependency in dependencies])
+        self.conn.commit()
+
     def mark_dependency_installed(self, app_id: int, dependency: str):
         """Mark a dependency as installed for an application."""
         from datetime import datetime
@@ -399,12 +433,17 @@ class Database:
         return dict(row) if row else {}
 
     # Settings operations
+    def _get_settings_cache(self) -> Dict[str, str]:
+        """Get the in-memory copy of the settings table, loading it once."""
+        if self._settings_cache is None:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT key, value FROM settings")
+            self._settings_cache = {row['key']: row['value'] for row in cursor.fetchall()}
+        return self._settings_cache
+
     def get_setting(self, key: str, default: str = None) -> Optional[str]:
         """Get a setting value."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        return row['value'] if row else default
+        return self._get_settings_cache().get(key, default)
 
     def set_setting(self, key: str, value: str):
         """Set a setting value."""
@@ -413,12 +452,20 @@ class Database:
             INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)
         """, (key, value))
         self.conn.commit()
+        self._get_settings_cache()[key] = value
+
+    def set_settings(self, settings: Dict[str, str]):
+        """Set several setting values in a single transaction."""
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)
+        """, settings.items())
+        self.conn.commit()
+        self._get_settings_cache().update(settings)
 
     def get_all_settings(self) -> Dict[str, str]:
         """Get all settings."""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT key, value FROM settings")
-        return {row['key']: row['value'] for row in cursor.fetchall()}
+        return dict(self._get_settings_cache())
 
     def close(self):
         """Close the database connection."""
@@ -172,9 +172,6 @@ class AddAppDialog(Adw.Window):
         """Load available prefixes into combo box."""
         prefixes = self.prefix_manager.get_all_prefixes()
 
-        self.prefix_list.splice(0, self.prefix_list.get_n_items(), [])
-        self.prefix_ids = []
-
         if not prefixes:
             # Create default prefix
             runner = self.runner_manager.get_default_runner()
@@ -183,9 +180,10 @@ class AddAppDialog(Adw.Window):
                 if success:
                     prefixes = self.prefix_manager.get_all_prefixes()
 
-        for prefix in prefixes:
-            self.prefix_list.append(prefix['name'])
-            self.prefix_ids.append(prefix['id'])
+        # Replace the dropdown contents in a single model change
+        self.prefix_list.splice(0, self.prefix_list.get_n_items(),
+                                [prefix['name'] for prefix in prefixes])
+        self.prefix_ids = [prefix['id'] for prefix in prefixes]
 
         if prefixes:
             self.prefix_combo.set_selected(0)
@@ -414,8 +412,7 @@ class AddAppDialog(Adw.Window):
             # Save dependency profiles for future reference
             if self.detected_deps:
                 logger.info(f"Saving dependency profile for app {app_id}")
-                for dep in self.detected_deps:
-                    self.db.add_app_dependency(app_id, dep, auto_detected=True)
+                self.db.add_app_dependencies(app_id, self.detected_deps, auto_detected=True)
                 logger.info("Dependency profiles saved")
 
             # Install dependencies
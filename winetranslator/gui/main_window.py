@@ -8,10 +8,22 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 gi.require_version('Gdk', '4.0')
-from gi.repository import Gtk, Adw, GLib, Gio, Gdk
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import Gtk, Adw, GLib, Gio, Gdk, GdkPixbuf, GObject
 import os
+import hashlib
+import itertools
+import shutil
+import subprocess
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 import logging
+import re
+import time
+from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 from ..database.db import Database
@@ -24,6 +36,129 @@ from ..core.updater import Updater
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Desktop directory (where user can see shortcut icons)
+_DESKTOP_DIR = os.path.expanduser('~/Desktop')
+
+# Characters not allowed in desktop shortcut file names
+_SANITIZE_RE = re.compile(r'[^\w \-]')
+
+# Virtual desktop resolutions offered in the enable dialog
+_VD_RESOLUTIONS = (
+    "1920x1080", "2560x1440", "3840x2160",  # Common 16:9
+    "1680x1050", "1920x1200", "2560x1600",  # Common 16:10
+    "1366x768", "1600x900", "1280x720"      # Other common
+)
+_VD_RESOLUTION_INDEX = {res: idx for idx, res in enumerate(_VD_RESOLUTIONS)}
+
+# Drop rounded corners, shadows and transitions from heavy lists when GTK
+# renders in software, where they are expensive to draw
+_FLAT_LISTS = os.environ.get('GSK_RENDERER') == 'cairo'
+
+# Environment variables stored for an app when controller support is enabled
+_CONTROLLER_ENV = MappingProxyType({
+    'SDL_GAMECONTROLLERCONFIG': 'auto',
+    'SDL_JOYSTICK_ALLOW_BACKGROUND_EVENTS': '1',
+    'WINE_ENABLE_GAMEPAD': '1',
+    'WINE_ENABLE_HIDRAW': '1',
+})
+
+# xinput DLLs forced to Wine's builtin implementation for controller support
+_XINPUT_DLLS = ('xinput1_4', 'xinput1_3', 'xinput1_2', 'xinput1_1', 'xinput9_1_0', 'xinputuap')
+
+# .reg file setting every xinput DLL override in a single regedit import
+_XINPUT_BUILTIN_REG = (
+    "Windows Registry Editor Version 5.00\n\n"
+    "[HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides]\n"
+    + "".join(f'"*{dll}"="builtin"\n' for dll in _XINPUT_DLLS)
+)
+
+# Joystick name fragments identifying Xbox controllers
+_CTRL_KEYWORDS = ('xbox', 'x-box', 'microsoft')
+
+# Executable name fragments of games that use XInput (modern controller API)
+_XINPUT_WORDS = (
+    'skyrim',           # Skyrim uses XInput
+    'fallout4',         # Fallout 4 uses XInput
+    'fallout3',         # Fallout 3 uses XInput
+    'witcher3',         # Witcher 3 uses XInput
+    'darksouls',        # Dark Souls uses XInput
+    'sekiro',           # Sekiro uses XInput
+    'eldenring',        # Elden Ring uses XInput
+)
+
+# Executable name fragments of games that use DirectInput (older games)
+_DINPUT_WORDS = (
+    'morrowind',        # Older Elder Scrolls games
+    'oblivion',         # Oblivion can use DirectInput
+    'gta_sa',           # GTA San Andreas
+    'nfs',              # Need for Speed series
+)
+
+_XINPUT_RE = re.compile('|'.join(map(re.escape, _XINPUT_WORDS)))
+_DINPUT_RE = re.compile('|'.join(map(re.escape, _DINPUT_WORDS)))
+
+# Library cards added to the grid per main loop iteration
+_APP_BATCH_SIZE = 50
+
+# Card icons are decoded off the main loop at this size and kept in a
+# bounded LRU cache of textures
+_ICON_SIZE = 64
+_ICON_CACHE_SIZE = 256
+
+# Icons pre-scaled to _ICON_SIZE, so later sessions skip the full decode
+_ICON_DISK_CACHE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+    'winetranslator', 'icons')
+
+# Fixed entries of the card context menu (label, card.* action)
+_CONTEXT_MENU_ITEMS = (
+    ("Open Install Directory", "open-directory"),
+    ("Edit Launch Arguments", "edit-arguments"),
+    ("Change Executable", "change-executable"),
+    ("Manage Dependencies", "manage-dependencies"),
+    ("Enable Controller Support", "enable-controller"),
+    ("Remap Controller Buttons", "remap-controller"),
+)
+
+@cache
+def _themed_icon(name: str) -> Gio.ThemedIcon:
+    """Get a shared GIcon for a theme icon name."""
+    return Gio.ThemedIcon.new(name)
+
+
+# Application card UI template, parsed by Gtk.Builder for each card
+_CARD_UI = (Path(__file__).parent / "app_card.ui").read_text()
+
+
+class _DependencyItem(GObject.Object):
+    """List model item for a dependency in the Manage Dependencies dialog."""
+
+    name = GObject.Property(type=str)
+    description = GObject.Property(type=str)
+    category = GObject.Property(type=str)
+    button_label = GObject.Property(type=str, default="Install")
+    button_sensitive = GObject.Property(type=bool, default=True)
+
+    def __init__(self, dep: dict):
+        super().__init__(name=dep['name'], description=dep['description'],
+                         category=dep['category'])
+
+
+class _AppItem(GObject.Object):
+    """List model item for an application card in the Library grid."""
+
+    id = GObject.Property(type=int)
+    name = GObject.Property(type=str)
+    prefix_name = GObject.Property(type=str)
+    icon_path = GObject.Property(type=str)
+    icon_ok = GObject.Property(type=bool, default=False)
+
+    def __init__(self, app: dict):
+        super().__init__(id=app['id'], name=app['name'],
+                         prefix_name=app['prefix_name'] or '',
+                         icon_path=app['icon_path'] or '',
+                         icon_ok=app.get('icon_ok', False))
+
 
 class MainWindow(Adw.ApplicationWindow):
     """Main application window."""
@@ -46,12 +181,66 @@ class MainWindow(Adw.ApplicationWindow):
         self.dep_manager = DependencyManager(db)
         self.updater = Updater()
 
+        # Pending coalesced refresh (see _request_refresh)
+        self._pending_refresh = False
+
+        # Whether _DESKTOP_DIR has been created this session
+        self._desktop_dir_ready = False
+
+        # Application rows by ID, so one user action costs one DB fetch
+        self._app_cache = {}
+
+        # Last application list shown in the library (None once stale)
+        self._apps_cache: Optional[list] = None
+
+        # Bumped for every background list load; older results are dropped
+        self._apps_generation = 0
+        # Whether a background list load is running (see _invalidate_app_cache)
+        self._apps_loading = False
+
+        # Idle source streaming the rest of a large list into the grid
+        self._populate_source_id = None
+
+        # Every env var of an app by app ID, loaded on first use and
+        # updated in lockstep with the database (see _set_env_vars_cached)
+        self._env_cache = {}
+
+        # Prefix rows by ID, primed when a card's context menu opens
+        self._prefix_cache = {}
+
+        # Card icon textures keyed by (path, mtime, size), oldest first
+        self._icon_cache = OrderedDict()
+        self._icon_cache_lock = threading.Lock()
+        self._icon_executor = ThreadPoolExecutor(max_workers=2)
+        self._icon_token = 0
+
+        # (timestamp, controllers) from the last _detect_xbox_controllers scan
+        self._controller_cache: Optional[tuple] = None
+
+        # Available dependencies grouped by category (static per process)
+        self._available_deps_cache: Optional[list] = None
+
+        # File filters for the change-executable dialog (built on first use)
+        self._exe_filter_model: Optional[Gio.ListStore] = None
+
+        # Dialogs reused across opens (built on first use, hidden on close)
+        self._vd_enable_dialog: Optional[Adw.MessageDialog] = None
+        self._vd_disable_dialog: Optional[Adw.MessageDialog] = None
+        self._edit_args_dialog: Optional[Adw.MessageDialog] = None
+
+        # Card context menu, shared by all cards (built on first use) and the
+        # (app_id, vd_enabled) its items currently target
+        self._context_menu: Optional[Gio.Menu] = None
+        self._context_popover: Optional[Gtk.PopoverMenu] = None
+        self._context_menu_key: Optional[tuple] = None
+
         # Setup context menu actions
         self._setup_context_actions()
 
         # Window properties
         self.set_title("WineTranslator")
         self.set_default_size(1000, 700)
+        self.connect("close-request", self._on_close_request)
 
         # Build UI
         self._build_ui()
@@ -59,50 +248,104 @@ class MainWindow(Adw.ApplicationWindow):
         # Initialize system
         GLib.idle_add(self._initialize_system)
 
+    def _on_close_request(self, window):
+        """Drop queued icon loads so they don't outlive the window."""
+        self._icon_executor.shutdown(wait=False, cancel_futures=True)
+        return False
+
     def _setup_context_actions(self):
-        """Setup actions for context menu."""
-        # Get the application
-        app = self.get_application()
-
-        # Open directory action (with parameter)
-        open_dir_action = Gio.SimpleAction.new("open-directory", GLib.VariantType.new("s"))
-        open_dir_action.connect("activate", self._on_open_directory_action)
-        app.add_action(open_dir_action)
-
-        # Edit arguments action (with parameter)
-        edit_args_action = Gio.SimpleAction.new("edit-arguments", GLib.VariantType.new("s"))
-        edit_args_action.connect("activate", self._on_edit_arguments_action)
-        app.add_action(edit_args_action)
-
-        # Change executable action (with parameter)
-        change_exe_action = Gio.SimpleAction.new("change-executable", GLib.VariantType.new("s"))
-        change_exe_action.connect("activate", self._on_change_executable_action)
-        app.add_action(change_exe_action)
-
-        # Manage dependencies action (with parameter)
-        manage_deps_action = Gio.SimpleAction.new("manage-dependencies", GLib.VariantType.new("s"))
-        manage_deps_action.connect("activate", self._on_manage_dependencies_action)
-        app.add_action(manage_deps_action)
-
-        # Enable controller action (with parameter)
-        enable_controller_action = Gio.SimpleAction.new("enable-controller", GLib.VariantType.new("s"))
-        enable_controller_action.connect("activate", self._on_enable_controller_action)
-        app.add_action(enable_controller_action)
-
-        # Remap controller action (with parameter)
-        remap_controller_action = Gio.SimpleAction.new("remap-controller", GLib.VariantType.new("s"))
-        remap_controller_action.connect("activate", self._on_remap_controller_action)
-        app.add_action(remap_controller_action)
-
-        # Toggle virtual desktop action (with parameter)
-        toggle_virtual_desktop_action = Gio.SimpleAction.new("toggle-virtual-desktop", GLib.VariantType.new("s"))
-        toggle_virtual_desktop_action.connect("activate", self._on_toggle_virtual_desktop_action)
-        app.add_action(toggle_virtual_desktop_action)
+        """Setup actions for context menu (card.<name>::<app_id>)."""
+        context_actions = (
+            ("open-directory", self._on_open_directory_action),
+            ("edit-arguments", self._on_edit_arguments_action),
+            ("change-executable", self._on_change_executable_action),
+            ("manage-dependencies", self._on_manage_dependencies_action),
+            ("enable-controller", self._on_enable_controller_action),
+            ("remap-controller", self._on_remap_controller_action),
+            ("toggle-virtual-desktop", self._on_toggle_virtual_desktop_action),
+        )
+
+        # All actions take the app ID as a string parameter
+        param_type = GLib.VariantType.new("s")
+        group = Gio.SimpleActionGroup()
+        for name, handler in context_actions:
+            action = Gio.SimpleAction.new(name, param_type)
+            action.connect("activate", handler)
+            group.add_action(action)
+
+        self.insert_action_group("card", group)
+
+    def _get_app_cached(self, app_id: int) -> Optional[dict]:
+        """Get an application by ID, reusing the last fetched row if present."""
+        app = self._app_cache.get(app_id)
+        if app is None:
+            app = self.app_launcher.get_application(app_id)
+            if app:
+                self._app_cache[app_id] = app
+        return app
+
+    def _invalidate_app_cache(self, app_id: Optional[int] = None):
+        """Drop a cached application row, or every row if no ID is given."""
+        # Any write makes the library list stale, including one a running
+        # load may have read before the write; drop its result and reload
+        self._apps_cache = None
+        self._apps_generation += 1
+        if self._apps_loading:
+            self._request_refresh()
+        if app_id is None:
+            self._app_cache.clear()
+            self._prefix_cache.clear()
+            self._env_cache.clear()
+        else:
+            self._app_cache.pop(app_id, None)
+            self._env_cache.pop(app_id, None)
+
+    def _get_env_cached(self, app_id: int) -> dict:
+        """Get all env vars of an application, loading them in one query."""
+        env = self._env_cache.get(app_id)
+        if env is None:
+            env = self._env_cache[app_id] = self.db.get_env_vars(app_id)
+        return env
+
+    def _set_env_vars_cached(self, app_id: int, env_vars):
+        """Store env vars for an application and keep the cached copy in sync."""
+        self.db.set_env_vars(app_id, env_vars)
+        env = self._env_cache.get(app_id)
+        if env is not None:
+            env.update(env_vars)
+
+    def _get_prefix_cached(self, prefix_id: int) -> Optional[dict]:
+        """Get a prefix by ID, reusing a row primed by _prefetch_for_menu."""
+        prefix = self._prefix_cache.get(prefix_id)
+        if prefix is None:
+            prefix = self.prefix_manager.get_prefix(prefix_id)
+            if prefix:
+                self._prefix_cache[prefix_id] = prefix
+        return prefix
+
+    def _prefetch_for_menu(self, app: dict):
+        """Prime the prefix cache for an app whose context menu is opening."""
+        prefix_id = app['prefix_id']
+        if prefix_id in self._prefix_cache:
+            return
+
+        def prefetch_thread():
+            prefix = self.prefix_manager.get_prefix(prefix_id)
+            if prefix:
+                GLib.idle_add(self._on_prefix_prefetched, prefix_id, prefix)
+
+        thread = threading.Thread(target=prefetch_thread, daemon=True)
+        thread.start()
+
+    def _on_prefix_prefetched(self, prefix_id: int, prefix: dict):
+        """Store a prefix row fetched by _prefetch_for_menu."""
+        self._prefix_cache.setdefault(prefix_id, prefix)
+        return False
 
     def _on_open_directory_action(self, action, parameter):
         """Handle open directory action from context menu."""
         app_id = int(parameter.get_string())
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
@@ -125,7 +368,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_change_executable_dialog(self, app_id: int):
         """Show dialog to change the executable for an app."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
@@ -133,21 +376,23 @@ class MainWindow(Adw.ApplicationWindow):
         dialog = Gtk.FileDialog()
         dialog.set_title("Select New Executable")
 
-        # Filter for .exe files
-        filter_exe = Gtk.FileFilter()
-        filter_exe.set_name("Windows Executables")
-        filter_exe.add_pattern("*.exe")
-        filter_exe.add_pattern("*.EXE")
+        # Filter for .exe files (built once, shared by every dialog)
+        if self._exe_filter_model is None:
+            filter_exe = Gtk.FileFilter()
+            filter_exe.set_name("Windows Executables")
+            filter_exe.add_pattern("*.exe")
+            filter_exe.add_pattern("*.EXE")
+
+            filter_all = Gtk.FileFilter()
+            filter_all.set_name("All Files")
+            filter_all.add_pattern("*")
 
-        filter_all = Gtk.FileFilter()
-        filter_all.set_name("All Files")
-        filter_all.add_pattern("*")
+            self._exe_filter_model = Gio.ListStore.new(Gtk.FileFilter)
+            self._exe_filter_model.append(filter_exe)
+            self._exe_filter_model.append(filter_all)
 
-        filters = Gio.ListStore.new(Gtk.FileFilter)
-        filters.append(filter_exe)
-        filters.append(filter_all)
-        dialog.set_filters(filters)
-        dialog.set_default_filter(filter_exe)
+        dialog.set_filters(self._exe_filter_model)
+        dialog.set_default_filter(self._exe_filter_model.get_item(0))
 
         # Set initial folder to current executable's directory
         current_exe = app.get('executable_path', '')
@@ -168,9 +413,10 @@ class MainWindow(Adw.ApplicationWindow):
 
                 # Update the database
                 self.db.update_application(app_id, executable_path=new_exe_path)
+                self._invalidate_app_cache(app_id)
 
                 # Refresh the UI
-                self._refresh_applications()
+                self._request_refresh()
 
                 # Show success toast
                 toast = Adw.Toast.new(f"Executable changed to {os.path.basename(new_exe_path)}")
@@ -188,7 +434,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_manage_dependencies_dialog(self, app_id: int):
         """Show dialog to manually install dependencies for an app."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
@@ -212,86 +458,149 @@ class MainWindow(Adw.ApplicationWindow):
         scrolled.set_vexpand(True)
         main_box.append(scrolled)
 
-        # Create list box for dependencies
-        list_box = Gtk.ListBox()
-        list_box.set_selection_mode(Gtk.SelectionMode.NONE)
-        list_box.add_css_class("boxed-list")
-        scrolled.set_child(list_box)
-
-        # Get available dependencies
-        from ..core.dependency_manager import DependencyManager
-        dep_manager = DependencyManager(self.db)
-        available_deps = dep_manager.get_available_dependencies()
-
-        # Group by category
-        categories = {}
-        for dep in available_deps:
-            category = dep['category']
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(dep)
-
-        # Add dependencies by category
-        for category, deps in sorted(categories.items()):
-            # Category header
-            category_row = Adw.PreferencesGroup()
-            category_row.set_title(category)
-            list_box.append(category_row)
-
-            for dep in deps:
-                row = Adw.ActionRow()
-                row.set_title(dep['name'])
-                row.set_subtitle(dep['description'])
-
-                # Install button
-                install_btn = Gtk.Button(label="Install")
-                install_btn.set_valign(Gtk.Align.CENTER)
-                install_btn.connect("clicked", self._on_install_dependency_clicked,
-                                  app_id, dep['name'], dialog)
-                row.add_suffix(install_btn)
-
-                category_row.add(row)
+        # Model: available dependencies grouped by category, filled one
+        # category per main-loop iteration once the dialog is up
+        store = Gio.ListStore.new(_DependencyItem)
+        deps_iter = self._populate_deps_iter(store, self._get_available_deps())
+        GLib.idle_add(lambda it=deps_iter: next(it, False))
+
+        # Rows are only realized for the visible part of the list
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_dependency_row_setup, app_id)
+        factory.connect("bind", self._on_dependency_row_bind)
+        factory.connect("unbind", self._on_dependency_row_unbind)
+
+        list_view = Gtk.ListView(model=Gtk.NoSelection.new(store), factory=factory)
+        if _FLAT_LISTS:
+            list_view.add_css_class("flat-list")
+
+        # Category headers (GTK 4.12+)
+        if hasattr(list_view, 'set_header_factory'):
+            sections = Gtk.SortListModel.new(store, None)
+            sections.set_section_sorter(Gtk.CustomSorter.new(self._compare_dependency_category, None))
+            list_view.set_model(Gtk.NoSelection.new(sections))
+
+            header_factory = Gtk.SignalListItemFactory()
+            header_factory.connect("setup", self._on_dependency_header_setup)
+            header_factory.connect("bind", self._on_dependency_header_bind)
+            list_view.set_header_factory(header_factory)
+
+        scrolled.set_child(list_view)
 
         dialog.present()
 
-    def _on_install_dependency_clicked(self, button, app_id: int, dep_name: str, parent_dialog):
+    def _get_available_deps(self) -> list:
+        """Get available dependencies sorted by category, computed once per window."""
+        if self._available_deps_cache is None:
+            # sorted() is stable, so the order within a category is preserved
+            self._available_deps_cache = sorted(
+                self.dep_manager.get_available_dependencies(),
+                key=lambda d: d['category']
+            )
+        return self._available_deps_cache
+
+    def _populate_deps_iter(self, store: Gio.ListStore, deps: list):
+        """Append dependencies to the store, yielding after each category."""
+        for category, group in itertools.groupby(deps, key=lambda d: d['category']):
+            store.splice(store.get_n_items(), 0, [_DependencyItem(dep) for dep in group])
+            yield True
+
+    def _compare_dependency_category(self, a, b, user_data=None):
+        """Section sorter: group dependency items by category."""
+        if a.category < b.category:
+            return Gtk.Ordering.SMALLER
+        if a.category > b.category:
+            return Gtk.Ordering.LARGER
+        return Gtk.Ordering.EQUAL
+
+    def _on_dependency_header_setup(self, factory, list_header):
+        """Create the category header widget."""
+        label = Gtk.Label(xalign=0)
+        label.add_css_class("heading")
+        label.set_margin_top(12)
+        label.set_margin_bottom(6)
+        label.set_margin_start(12)
+        list_header.set_child(label)
+
+    def _on_dependency_header_bind(self, factory, list_header):
+        """Show the category of the section in its header."""
+        list_header.get_child().set_label(list_header.get_item().category)
+
+    def _on_dependency_row_setup(self, factory, list_item, app_id: int):
+        """Create a reusable dependency row with its install button."""
+        row = Adw.ActionRow()
+
+        # Install button
+        install_btn = Gtk.Button(label="Install")
+        install_btn.set_valign(Gtk.Align.CENTER)
+        install_btn.connect("clicked", self._on_install_dependency_clicked, list_item, app_id)
+        row.add_suffix(install_btn)
+
+        row.install_btn = install_btn  # Store reference
+        list_item.set_child(row)
+
+    def _on_dependency_row_bind(self, factory, list_item):
+        """Fill a recycled row with the dependency it now shows."""
+        item = list_item.get_item()
+        row = list_item.get_child()
+        row.set_title(item.name)
+        row.set_subtitle(item.description)
+
+        # Install state lives on the item so it survives row recycling
+        flags = GObject.BindingFlags.SYNC_CREATE
+        row.bindings = [
+            item.bind_property('button-label', row.install_btn, 'label', flags),
+            item.bind_property('button-sensitive', row.install_btn, 'sensitive', flags),
+        ]
+
+    def _on_dependency_row_unbind(self, factory, list_item):
+        """Detach a row from the dependency it showed."""
+        row = list_item.get_child()
+        for binding in row.bindings:
+            binding.unbind()
+        row.bindings = []
+
+    def _on_install_dependency_clicked(self, button, list_item, app_id: int):
         """Handle install dependency button click."""
-        app = self.app_launcher.get_application(app_id)
+        item = list_item.get_item()
+        if item is None:
+            return
+        dep_name = item.name
+
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
         prefix_id = app['prefix_id']
-        prefix = self.prefix_manager.get_prefix(prefix_id)
+        prefix = self._get_prefix_cached(prefix_id)
         if not prefix:
             return
 
         # Disable button during installation
-        button.set_sensitive(False)
-        button.set_label("Installing...")
+        item.button_sensitive = False
+        item.button_label = "Installing..."
 
         def install_thread():
-            from ..core.dependency_manager import DependencyManager
-            dep_manager = DependencyManager(self.db)
-
-            success, message = dep_manager.install_dependency(
+            success, message = self.dep_manager.install_dependency(
                 prefix['path'],
                 dep_name,
                 prefix.get('runner_path')
             )
 
-            GLib.idle_add(self._on_dependency_installed, success, message, dep_name, button)
+            GLib.idle_add(self._on_dependency_installed, success, message, item)
 
         thread = threading.Thread(target=install_thread, daemon=True)
         thread.start()
 
-    def _on_dependency_installed(self, success: bool, message: str, dep_name: str, button):
+    def _on_dependency_installed(self, success: bool, message: str, item: _DependencyItem):
         """Handle dependency installation completion."""
+        dep_name = item.name
         if success:
-            button.set_label("Installed ✓")
+            item.button_label = "Installed ✓"
             toast = Adw.Toast.new(f"{dep_name} installed successfully")
         else:
-            button.set_label("Failed ✗")
-            button.set_sensitive(True)
+            item.button_label = "Failed ✗"
+            item.button_sensitive = True
             toast = Adw.Toast.new(f"Failed to install {dep_name}: {message}")
 
         toast.set_timeout(3)
@@ -315,31 +624,27 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_virtual_desktop_dialog(self, app_id: int):
         """Show dialog to configure virtual desktop settings."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
         # Check current state
-        vd_enabled = self.db.get_env_var(app_id, 'WINE_VIRTUAL_DESKTOP_ENABLED')
-        current_resolution = self.db.get_env_var(app_id, 'WINE_VIRTUAL_DESKTOP_RESOLUTION') or '1920x1080'
+        vd_vars = self._get_env_cached(app_id)
+        vd_enabled = vd_vars.get('WINE_VIRTUAL_DESKTOP_ENABLED')
+        current_resolution = vd_vars.get('WINE_VIRTUAL_DESKTOP_RESOLUTION') or '1920x1080'
 
         if vd_enabled == '1':
             # Currently enabled - show disable confirmation
-            dialog = Adw.MessageDialog.new(self)
-            dialog.set_heading("Disable Virtual Desktop?")
+            dialog = self._get_vd_disable_dialog()
             dialog.set_body(
                 f"Virtual Desktop mode is currently enabled for {app['name']}.\n\n"
                 "Disabling it will allow the game to use fullscreen mode, which may "
                 "take over your entire screen and make Alt+Tab difficult."
             )
-            dialog.add_response("cancel", "Cancel")
-            dialog.add_response("disable", "Disable")
-            dialog.set_response_appearance("disable", Adw.ResponseAppearance.DESTRUCTIVE)
-            dialog.connect("response", self._on_virtual_desktop_disable_response, app_id)
+            self._rebind_dialog_response(dialog, self._on_virtual_desktop_disable_response, app_id)
         else:
             # Currently disabled - show enable dialog with resolution options
-            dialog = Adw.MessageDialog.new(self)
-            dialog.set_heading("Enable Virtual Desktop?")
+            dialog = self._get_vd_enable_dialog()
             dialog.set_body(
                 f"Virtual Desktop mode will run {app['name']} in a contained Wine window.\n\n"
                 "This prevents fullscreen games from taking over your entire screen, "
@@ -347,6 +652,38 @@ class MainWindow(Adw.ApplicationWindow):
                 "Choose a resolution for the virtual desktop window:"
             )
 
+            # Set current selection (default to 1920x1080)
+            dialog.resolution_dropdown.set_selected(_VD_RESOLUTION_INDEX.get(current_resolution, 0))
+            self._rebind_dialog_response(dialog, self._on_virtual_desktop_enable_response, app_id)
+
+        dialog.present()
+
+    def _rebind_dialog_response(self, dialog, handler, *args):
+        """Point a reused dialog's response signal at a new handler invocation."""
+        handler_id = getattr(dialog, 'response_handler_id', None)
+        if handler_id is not None:
+            dialog.disconnect(handler_id)
+        dialog.response_handler_id = dialog.connect("response", handler, *args)
+
+    def _get_vd_disable_dialog(self) -> Adw.MessageDialog:
+        """Get the (reused) virtual desktop disable confirmation dialog."""
+        if self._vd_disable_dialog is None:
+            dialog = Adw.MessageDialog.new(self)
+            dialog.set_hide_on_close(True)
+            dialog.set_heading("Disable Virtual Desktop?")
+            dialog.add_response("cancel", "Cancel")
+            dialog.add_response("disable", "Disable")
+            dialog.set_response_appearance("disable", Adw.ResponseAppearance.DESTRUCTIVE)
+            self._vd_disable_dialog = dialog
+        return self._vd_disable_dialog
+
+    def _get_vd_enable_dialog(self) -> Adw.MessageDialog:
+        """Get the (reused) virtual desktop enable dialog with its resolution picker."""
+        if self._vd_enable_dialog is None:
+            dialog = Adw.MessageDialog.new(self)
+            dialog.set_hide_on_close(True)
+            dialog.set_heading("Enable Virtual Desktop?")
+
             # Add resolution selection
             box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
             box.set_margin_top(10)
@@ -359,20 +696,7 @@ class MainWindow(Adw.ApplicationWindow):
             resolution_label.set_xalign(0)
             box.append(resolution_label)
 
-            resolutions = [
-                "1920x1080", "2560x1440", "3840x2160",  # Common 16:9
-                "1680x1050", "1920x1200", "2560x1600",  # Common 16:10
-                "1366x768", "1600x900", "1280x720"      # Other common
-            ]
-
-            resolution_dropdown = Gtk.DropDown.new_from_strings(resolutions)
-            # Set current selection
-            try:
-                current_idx = resolutions.index(current_resolution)
-                resolution_dropdown.set_selected(current_idx)
-            except ValueError:
-                resolution_dropdown.set_selected(0)  # Default to 1920x1080
-
+            resolution_dropdown = Gtk.DropDown.new_from_strings(_VD_RESOLUTIONS)
             box.append(resolution_dropdown)
 
             dialog.set_extra_child(box)
@@ -381,27 +705,23 @@ class MainWindow(Adw.ApplicationWindow):
             dialog.set_response_appearance("enable", Adw.ResponseAppearance.SUGGESTED)
 
             dialog.resolution_dropdown = resolution_dropdown  # Store reference
-            dialog.connect("response", self._on_virtual_desktop_enable_response, app_id)
-
-        dialog.present()
+            self._vd_enable_dialog = dialog
+        return self._vd_enable_dialog
 
     def _on_virtual_desktop_enable_response(self, dialog, response, app_id: int):
         """Handle virtual desktop enable response."""
         if response == "enable":
             # Get selected resolution
             selected_idx = dialog.resolution_dropdown.get_selected()
-            resolutions = [
-                "1920x1080", "2560x1440", "3840x2160",
-                "1680x1050", "1920x1200", "2560x1600",
-                "1366x768", "1600x900", "1280x720"
-            ]
-            resolution = resolutions[selected_idx]
+            resolution = _VD_RESOLUTIONS[selected_idx]
 
             # Enable virtual desktop
-            self.db.set_env_var(app_id, 'WINE_VIRTUAL_DESKTOP_ENABLED', '1')
-            self.db.set_env_var(app_id, 'WINE_VIRTUAL_DESKTOP_RESOLUTION', resolution)
+            self._set_env_vars_cached(app_id, {
+                'WINE_VIRTUAL_DESKTOP_ENABLED': '1',
+                'WINE_VIRTUAL_DESKTOP_RESOLUTION': resolution,
+            })
 
-            app = self.app_launcher.get_application(app_id)
+            app = self._get_app_cached(app_id)
             toast = Adw.Toast.new(f"Virtual Desktop enabled for {app['name']} ({resolution})")
             toast.set_timeout(3)
             self.toast_overlay.add_toast(toast)
@@ -412,9 +732,9 @@ class MainWindow(Adw.ApplicationWindow):
         """Handle virtual desktop disable response."""
         if response == "disable":
             # Disable virtual desktop
-            self.db.set_env_var(app_id, 'WINE_VIRTUAL_DESKTOP_ENABLED', '0')
+            self._set_env_vars_cached(app_id, {'WINE_VIRTUAL_DESKTOP_ENABLED': '0'})
 
-            app = self.app_launcher.get_application(app_id)
+            app = self._get_app_cached(app_id)
             toast = Adw.Toast.new(f"Virtual Desktop disabled for {app['name']}")
             toast.set_timeout(3)
             self.toast_overlay.add_toast(toast)
@@ -442,33 +762,38 @@ class MainWindow(Adw.ApplicationWindow):
             logger.error(f"Failed to open controller remapping dialog: {e}")
 
     def _detect_xbox_controllers(self):
-        """Detect connected Xbox controllers."""
+        """Scan /dev/input for connected Xbox controllers (safe off the main loop)."""
         controllers = []
         try:
             # Check /dev/input/js* devices
-            import glob
-            js_devices = glob.glob('/dev/input/js*')
+            for entry in os.scandir('/dev/input'):
+                if not entry.name.startswith('js'):
+                    continue
 
-            for device in js_devices:
+                device = entry.path
                 try:
                     # Try to read device name
-                    device_num = device.replace('/dev/input/js', '')
+                    device_num = entry.name[2:]
                     event_device = f'/sys/class/input/js{device_num}/device/name'
 
-                    if os.path.exists(event_device):
-                        with open(event_device, 'r') as f:
-                            name = f.read().strip()
-
-                        # Check if it's an Xbox controller
-                        if any(x in name.lower() for x in ['xbox', 'x-box', 'microsoft']):
-                            controllers.append({
-                                'device': device,
-                                'name': name,
-                                'number': device_num
-                            })
+                    try:
+                        name = Path(event_device).read_text().strip()
+                    except FileNotFoundError:
+                        continue
+
+                    # Check if it's an Xbox controller
+                    name_l = name.lower()
+                    if any(k in name_l for k in _CTRL_KEYWORDS):
+                        controllers.append({
+                            'device': device,
+                            'name': name,
+                            'number': device_num
+                        })
                 except Exception as e:
-                    logger.debug(f"Error reading device {device}: {e}")
+                    logger.debug("Error reading device %s: %s", device, e)
 
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Error detecting controllers: {e}")
 
@@ -476,51 +801,51 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _detect_controller_api(self, app_id: int):
         """Detect which controller API a game likely uses (DirectInput or XInput)."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return "unknown"
 
         exe_path = app.get('executable_path', '').lower()
 
-        # Check for common XInput indicators
-        xinput_indicators = [
-            'skyrim',           # Skyrim uses XInput
-            'fallout4',         # Fallout 4 uses XInput
-            'fallout3',         # Fallout 3 uses XInput
-            'witcher3',         # Witcher 3 uses XInput
-            'darksouls',        # Dark Souls uses XInput
-            'sekiro',           # Sekiro uses XInput
-            'eldenring',        # Elden Ring uses XInput
-        ]
+        # Check for common XInput indicators, then DirectInput ones
+        if _XINPUT_RE.search(exe_path):
+            return "xinput"
 
-        # Check for common DirectInput indicators (older games)
-        dinput_indicators = [
-            'morrowind',        # Older Elder Scrolls games
-            'oblivion',         # Oblivion can use DirectInput
-            'gta_sa',           # GTA San Andreas
-            'nfs',              # Need for Speed series
-        ]
-
-        for indicator in xinput_indicators:
-            if indicator in exe_path:
-                return "xinput"
-
-        for indicator in dinput_indicators:
-            if indicator in exe_path:
-                return "dinput"
+        if _DINPUT_RE.search(exe_path):
+            return "dinput"
 
         # Default to auto-detect (will check for xinput DLLs in game directory)
         return "unknown"
 
     def _show_enable_controller_dialog(self, app_id: int):
+        """Detect controllers in the background, then show the enable dialog."""
+        detected_api = self._detect_controller_api(app_id)
+
+        # Reuse a scan from the last couple of seconds
+        if self._controller_cache is not None:
+            timestamp, controllers = self._controller_cache
+            if time.monotonic() - timestamp < 2.0:
+                self._finish_show_enable_controller_dialog(app_id, controllers, detected_api)
+                return
+
+        def detect_thread():
+            controllers = self._detect_xbox_controllers()
+            GLib.idle_add(self._on_controllers_detected,
+                          app_id, controllers, detected_api)
+
+        thread = threading.Thread(target=detect_thread, daemon=True)
+        thread.start()
+
+    def _on_controllers_detected(self, app_id: int, controllers: list, detected_api: str):
+        """Cache a finished controller scan and show the enable dialog."""
+        self._controller_cache = (time.monotonic(), controllers)
+        return self._finish_show_enable_controller_dialog(app_id, controllers, detected_api)
+
+    def _finish_show_enable_controller_dialog(self, app_id: int, controllers: list, detected_api: str):
         """Show dialog to enable controller support for an app."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
-            return
-
-        # Detect controllers
-        controllers = self._detect_xbox_controllers()
-        detected_api = self._detect_controller_api(app_id)
+            return False
 
         # Create dialog with custom content
         dialog = Adw.MessageDialog.new(self)
@@ -561,6 +886,7 @@ class MainWindow(Adw.ApplicationWindow):
 
         dialog.connect("response", self._on_enable_controller_response, app_id)
         dialog.present()
+        return False
 
     def _on_enable_controller_response(self, dialog, response, app_id: int):
         """Handle enable controller dialog response."""
@@ -570,23 +896,25 @@ class MainWindow(Adw.ApplicationWindow):
         # Determine which API to use
         api_mode = response  # "auto", "dinput", or "xinput"
 
-        app = self.app_launcher.get_application(app_id)
-        if not app:
-            return
-
-        prefix_id = app['prefix_id']
-        prefix = self.prefix_manager.get_prefix(prefix_id)
-        if not prefix:
+        # The application row already carries its prefix and runner paths
+        app = self._get_app_cached(app_id)
+        if not app or not app.get('prefix_path'):
             return
+        prefix_path = app['prefix_path']
+        runner_path = app.get('runner_path')
 
         # Auto-detect mode: check game directory for xinput DLLs
         if api_mode == "auto":
             exe_path = app.get('executable_path', '')
             if exe_path:
                 game_dir = os.path.dirname(exe_path)
-                # Check if game has xinput DLLs
-                has_xinput = any(os.path.exists(os.path.join(game_dir, f"xinput{ver}.dll"))
-                                for ver in ['1_4', '1_3', '1_2', '1_1', '9_1_0'])
+                # Check if game has xinput DLLs (one directory listing, case-insensitive)
+                try:
+                    names = {entry.name.lower() for entry in os.scandir(game_dir)}
+                except OSError:
+                    names = set()
+                has_xinput = any(f"xinput{ver}.dll" in names
+                                for ver in ('1_4', '1_3', '1_2', '1_1', '9_1_0'))
 
                 if has_xinput:
                     api_mode = "xinput"
@@ -613,70 +941,70 @@ class MainWindow(Adw.ApplicationWindow):
         self._controller_api_mode = api_mode
 
         def enable_thread():
-            import subprocess
-            from ..core.dependency_manager import DependencyManager
-            dep_manager = DependencyManager(self.db)
-
-            # Set common environment variables for controller support
-            self.db.set_env_var(app_id, 'SDL_GAMECONTROLLERCONFIG', 'auto')
-            self.db.set_env_var(app_id, 'SDL_JOYSTICK_ALLOW_BACKGROUND_EVENTS', '1')
-            self.db.set_env_var(app_id, 'WINE_ENABLE_GAMEPAD', '1')
-            self.db.set_env_var(app_id, 'WINE_ENABLE_HIDRAW', '1')
+            # Set common environment variables for controller support; the
+            # cached copy is refreshed in _on_controller_enabled
+            self.db.set_env_vars(app_id, _CONTROLLER_ENV)
 
             env = os.environ.copy()
-            env['WINEPREFIX'] = prefix['path']
-            if prefix.get('runner_path'):
-                env['WINE'] = prefix['runner_path']
-
+            env['WINEPREFIX'] = prefix_path
+            if runner_path:
+                env['WINE'] = runner_path
+            # Configuration only: skip debug channel setup
+            env['WINEDEBUG'] = '-all'
+
+            # Both modes use Wine's built-in xinput, which also translates
+            # DirectInput devices; they differ only in the messages shown
             if api_mode == "dinput":
-                # DirectInput mode: Use Wine's built-in DirectInput support
-                logger.info("Configuring DirectInput controller support")
-
-                # Set xinput DLLs to builtin (use Wine's implementation)
-                xinput_dlls = ['xinput1_4', 'xinput1_3', 'xinput1_2', 'xinput1_1', 'xinput9_1_0', 'xinputuap']
-                for dll in xinput_dlls:
-                    try:
-                        subprocess.run(
-                            ['wine', 'reg', 'add', 'HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides',
-                             '/v', f'*{dll}', '/t', 'REG_SZ', '/d', 'builtin', '/f'],
-                            env=env,
-                            capture_output=True,
-                            timeout=10
-                        )
-                        logger.info(f"Set {dll} to builtin (Wine DirectInput)")
-                    except Exception as e:
-                        logger.warning(f"Failed to set override for {dll}: {e}")
-
-                GLib.idle_add(self._on_controller_enabled, True, "DirectInput controller support enabled", progress_dialog)
-
+                mode_label = "DirectInput"
+                message = "DirectInput controller support enabled"
             else:  # xinput mode
-                # XInput mode: Use Wine's built-in XInput support (DirectInput translation)
-                logger.info("Configuring XInput controller support (Wine builtin)")
+                mode_label = "XInput"
+                message = "XInput controller support enabled (Wine builtin)"
+            logger.info(f"Configuring {mode_label} controller support (Wine builtin)")
+
+            # Set xinput DLLs to builtin (use Wine's implementation)
+            success = self._import_registry(_XINPUT_BUILTIN_REG, env)
+            if success:
+                logger.info(f"Set {', '.join(_XINPUT_DLLS)} to builtin (Wine {mode_label})")
+            else:
+                message = "Could not write the xinput DLL overrides to the Wine registry"
 
-                # Set xinput DLLs to builtin (use Wine's implementation which supports DirectInput)
-                xinput_dlls = ['xinput1_4', 'xinput1_3', 'xinput1_2', 'xinput1_1', 'xinput9_1_0', 'xinputuap']
-                for dll in xinput_dlls:
-                    try:
-                        subprocess.run(
-                            ['wine', 'reg', 'add', 'HKEY_CURRENT_USER\\Software\\Wine\\DllOverrides',
-                             '/v', f'*{dll}', '/t', 'REG_SZ', '/d', 'builtin', '/f'],
-                            env=env,
-                            capture_output=True,
-                            timeout=10
-                        )
-                        logger.info(f"Set {dll} to builtin (Wine XInput)")
-                    except Exception as e:
-                        logger.warning(f"Failed to set override for {dll}: {e}")
-
-                GLib.idle_add(self._on_controller_enabled, True, "XInput controller support enabled (Wine builtin)", progress_dialog)
+            GLib.idle_add(self._on_controller_enabled, app_id, success, message, progress_dialog)
 
         thread = threading.Thread(target=enable_thread, daemon=True)
         thread.start()
 
-    def _on_controller_enabled(self, success: bool, message: str, progress_dialog):
+    def _import_registry(self, reg_content: str, env: dict) -> bool:
+        """Import registry settings into a prefix with a single regedit run."""
+        try:
+            # Feed the .reg data on stdin ("-"), so the import doesn't depend
+            # on the prefix mapping a host path through its Z: drive
+            result = subprocess.run(
+                ['wine', 'regedit', '/S', '-'],
+                env=env,
+                input=reg_content,
+                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30
+            )
+        except Exception as e:
+            logger.warning(f"Failed to import registry settings: {e}")
+            return False
+
+        if result.returncode != 0:
+            logger.warning(f"Failed to import registry settings: regedit exited with {result.returncode}")
+            return False
+        return True
+
+    def _on_controller_enabled(self, app_id: int, success: bool, message: str, progress_dialog):
         """Handle controller enablement completion."""
         progress_dialog.close()
 
+        env = self._env_cache.get(app_id)
+        if env is not None:
+            env.update(_CONTROLLER_ENV)
+
         if success:
             result_dialog = Adw.MessageDialog.new(self)
             result_dialog.set_heading("Controller Support Enabled")
@@ -710,36 +1038,42 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_edit_arguments_dialog(self, app_id: int):
         """Show dialog to edit launch arguments."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
-        # Create dialog
-        dialog = Adw.MessageDialog.new(self)
-        dialog.set_heading(f"Edit Launch Arguments - {app['name']}")
-        dialog.set_body("Enter command-line arguments to pass to the application when launching.\nExample: -console -windowed -fullscreen")
+        # Create the dialog on first use, then reuse it
+        if self._edit_args_dialog is None:
+            dialog = Adw.MessageDialog.new(self)
+            dialog.set_hide_on_close(True)
+            dialog.set_body("Enter command-line arguments to pass to the application when launching.\nExample: -console -windowed -fullscreen")
 
-        # Add response buttons
-        dialog.add_response("cancel", "Cancel")
-        dialog.add_response("save", "Save")
-        dialog.set_response_appearance("save", Adw.ResponseAppearance.SUGGESTED)
-
-        # Create entry for arguments
-        entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        entry_box.set_margin_start(12)
-        entry_box.set_margin_end(12)
-        entry_box.set_margin_top(12)
-        entry_box.set_margin_bottom(12)
-
-        entry = Gtk.Entry()
-        entry.set_placeholder_text("Launch arguments...")
-        current_args = app.get('arguments', '') or ''
-        entry.set_text(current_args)
-        entry_box.append(entry)
+            # Add response buttons
+            dialog.add_response("cancel", "Cancel")
+            dialog.add_response("save", "Save")
+            dialog.set_response_appearance("save", Adw.ResponseAppearance.SUGGESTED)
 
-        dialog.set_extra_child(entry_box)
+            # Create entry for arguments
+            entry_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+            entry_box.set_margin_start(12)
+            entry_box.set_margin_end(12)
+            entry_box.set_margin_top(12)
+            entry_box.set_margin_bottom(12)
 
-        dialog.connect("response", self._on_edit_arguments_response, app_id, entry)
+            entry = Gtk.Entry()
+            entry.set_placeholder_text("Launch arguments...")
+            entry_box.append(entry)
+
+            dialog.set_extra_child(entry_box)
+            dialog.entry = entry  # Store reference
+            self._edit_args_dialog = dialog
+
+        dialog = self._edit_args_dialog
+        dialog.set_heading(f"Edit Launch Arguments - {app['name']}")
+        current_args = app.get('arguments', '') or ''
+        dialog.entry.set_text(current_args)
+
+        self._rebind_dialog_response(dialog, self._on_edit_arguments_response, app_id, dialog.entry)
         dialog.present()
 
     def _on_edit_arguments_response(self, dialog, response, app_id: int, entry: Gtk.Entry):
@@ -748,6 +1082,7 @@ class MainWindow(Adw.ApplicationWindow):
             arguments = entry.get_text().strip()
             # Update in database
             self.db.update_application(app_id, arguments=arguments)
+            self._invalidate_app_cache(app_id)
             logger.info(f"Updated launch arguments for app {app_id}: {arguments}")
 
             toast = Adw.Toast.new("Launch arguments updated")
@@ -799,41 +1134,60 @@ class MainWindow(Adw.ApplicationWindow):
         library_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
         library_page = self.tab_view.append(library_box)
         library_page.set_title("Library")
-        library_page.set_icon(Gio.ThemedIcon.new("folder-symbolic"))
+        library_page.set_icon(_themed_icon("folder-symbolic"))
+
+        # Stack switching between the application grid and the empty state
+        self.library_stack = Gtk.Stack()
+        self.library_stack.set_vexpand(True)
+        self.library_stack.set_hexpand(True)
+        library_box.append(self.library_stack)
 
         # Scrolled window for library
         scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        scrolled.set_hexpand(True)
-        library_box.append(scrolled)
-
-        # Flow box for application icons
-        self.app_flow_box = Gtk.FlowBox()
-        self.app_flow_box.set_valign(Gtk.Align.START)
-        self.app_flow_box.set_max_children_per_line(6)
-        self.app_flow_box.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.app_flow_box.set_margin_top(12)
-        self.app_flow_box.set_margin_bottom(12)
-        self.app_flow_box.set_margin_start(12)
-        self.app_flow_box.set_margin_end(12)
-        self.app_flow_box.set_row_spacing(12)
-        self.app_flow_box.set_column_spacing(12)
-        scrolled.set_child(self.app_flow_box)
+        self.library_stack.add_named(scrolled, "apps")
+
+        # Grid view for application icons; only visible cards are realized
+        # and card widgets are recycled as the user scrolls
+        self.app_store = Gio.ListStore.new(_AppItem)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_app_card_setup)
+        factory.connect("bind", self._on_app_card_bind)
+        factory.connect("unbind", self._on_app_card_unbind)
+
+        self.app_grid_view = Gtk.GridView(model=Gtk.NoSelection.new(self.app_store),
+                                          factory=factory)
+        self.app_grid_view.set_max_columns(6)
+        self.app_grid_view.set_min_columns(1)
+        self.app_grid_view.set_margin_top(12)
+        self.app_grid_view.set_margin_bottom(12)
+        self.app_grid_view.set_margin_start(12)
+        self.app_grid_view.set_margin_end(12)
+
+        # One right-click handler for the whole grid; the card under the
+        # pointer is resolved on press (see _on_grid_right_clicked)
+        right_click = Gtk.GestureClick.new()
+        right_click.set_button(3)  # Right mouse button
+        right_click.connect("pressed", self._on_grid_right_clicked)
+        self.app_grid_view.add_controller(right_click)
+        scrolled.set_child(self.app_grid_view)
 
         # Empty state
         self.empty_state = self._create_empty_state()
+        self.library_stack.add_named(self.empty_state, "empty")
 
-        # Tested Apps tab
-        from .tested_apps_view import TestedAppsView
-        tested_apps_view = TestedAppsView(
-            self.db,
-            self.runner_manager,
-            self.prefix_manager,
-            self.dep_manager
-        )
-        tested_page = self.tab_view.append(tested_apps_view)
-        tested_page.set_title("Tested Apps")
-        tested_page.set_icon(Gio.ThemedIcon.new("starred-symbolic"))
+        # Loading state, shown until the first application list arrives
+        spinner = Gtk.Spinner(spinning=True, width_request=32, height_request=32,
+                              halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
+        self.library_stack.add_named(spinner, "loading")
+        self.library_stack.set_visible_child_name("loading")
+
+        # Tested Apps tab; the view itself is built on first selection
+        self.tested_apps_bin = Adw.Bin()
+        self.tested_page = self.tab_view.append(self.tested_apps_bin)
+        self.tested_page.set_title("Tested Apps")
+        self.tested_page.set_icon(_themed_icon("starred-symbolic"))
+        self.tab_view.connect("notify::selected-page", self._ensure_tested_view)
 
         # Status page placeholder (shown when no apps)
         self.status_page = Adw.StatusPage()
@@ -841,6 +1195,20 @@ class MainWindow(Adw.ApplicationWindow):
         self.status_page.set_description("Add Windows applications to get started")
         self.status_page.set_icon_name("application-x-executable-symbolic")
 
+    def _ensure_tested_view(self, tab_view, pspec):
+        """Build the Tested Apps view the first time its tab is selected."""
+        if tab_view.get_selected_page() != self.tested_page:
+            return
+
+        from .tested_apps_view import TestedAppsView
+        self.tested_apps_bin.set_child(TestedAppsView(
+            self.db,
+            self.runner_manager,
+            self.prefix_manager,
+            self.dep_manager
+        ))
+        tab_view.disconnect_by_func(self._ensure_tested_view)
+
     def _create_empty_state(self) -> Gtk.Box:
         """Create empty state widget."""
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -859,130 +1227,273 @@ class MainWindow(Adw.ApplicationWindow):
         return box
 
     def _initialize_system(self):
-        """Initialize Wine runners and load applications."""
+        """Initialize Wine runners and load applications in the background."""
+        self._apps_generation += 1
+        self._apps_loading = True
+        thread = threading.Thread(target=self._bg_init, args=(self._apps_generation,),
+                                  daemon=True)
+        thread.start()
+        return False
+
+    def _bg_init(self, generation: int):
+        """Worker thread: ensure a runner exists and preload the application list."""
         # Ensure we have at least one Wine runner
         try:
             self.runner_manager.ensure_default_runner()
         except RuntimeError as e:
-            self._show_error_dialog("Wine Not Found", str(e))
-            return
+            GLib.idle_add(self._show_error_dialog, "Wine Not Found", str(e))
 
         # Load applications
+        self._load_apps_bg(generation)
+
+    def _load_apps_bg(self, generation: int):
+        """Worker thread: fetch the application list and hand it to the UI."""
+        apps = self.app_launcher.get_all_applications()
+
+        # Check icon files here so binding a card never touches the disk
+        for app in apps:
+            app['icon_ok'] = bool(app['icon_path']) and os.path.isfile(app['icon_path'])
+
+        GLib.idle_add(self._apply_apps, apps, generation)
+
+    def _apply_apps(self, apps: list, generation: int):
+        """Populate the library with a list fetched by _load_apps_bg."""
+        # A newer load was started meanwhile (e.g. an app was added)
+        if generation == self._apps_generation:
+            self._apps_loading = False
+            self._populate_applications(apps)
+        return False
+
+    def _request_refresh(self):
+        """Schedule a refresh, coalescing rapid requests into a single rebuild."""
+        if self._pending_refresh:
+            return
+        self._pending_refresh = True
+        GLib.timeout_add(50, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run a coalesced refresh scheduled by _request_refresh."""
+        self._pending_refresh = False
         self._refresh_applications()
+        return GLib.SOURCE_REMOVE
 
     def _refresh_applications(self):
         """Refresh the application list."""
-        # Clear existing items
-        child = self.app_flow_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.app_flow_box.remove(child)
-            child = next_child
-
-        # Load applications from database
-        apps = self.app_launcher.get_all_applications()
-
-        if not apps:
-            # Show empty state
-            self.app_flow_box.append(self.empty_state)
+        # Reuse the last list while it is still valid
+        if self._apps_cache is not None:
+            self._populate_applications(self._apps_cache)
             return
 
-        # Add application cards
-        for app in apps:
-            card = self._create_app_card(app)
-            self.app_flow_box.append(card)
+        # Otherwise load applications from database in the background
+        self._apps_generation += 1
+        self._apps_loading = True
+        thread = threading.Thread(target=self._load_apps_bg, args=(self._apps_generation,),
+                                  daemon=True)
+        thread.start()
 
-    def _create_app_card(self, app: dict) -> Gtk.Box:
-        """Create an application card widget."""
-        # Main card container
-        card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        card.set_size_request(150, 200)
-        card.add_css_class("card")
-        card.add_css_class("app-card")
+    def _populate_applications(self, apps: list):
+        """Replace the library contents with cards for the given applications."""
+        # The bulk query returns full rows, so it also primes the per-ID cache
+        self._apps_cache = apps
+        self._app_cache = {app['id']: app for app in apps}
+
+        # Stop streaming a list that is being replaced
+        if self._populate_source_id is not None:
+            GLib.source_remove(self._populate_source_id)
+            self._populate_source_id = None
+
+        # Swap in the first batch right away; the grid recycles its card
+        # widgets, and the rest follows one batch per idle so a large library
+        # is laid out across several frames
+        batches = (apps[i:i + _APP_BATCH_SIZE] for i in range(0, len(apps), _APP_BATCH_SIZE))
+        self.app_store.splice(0, self.app_store.get_n_items(),
+                              [_AppItem(app) for app in next(batches, [])])
+        if len(apps) > _APP_BATCH_SIZE:
+            self._populate_source_id = GLib.idle_add(self._splice_app_batch, batches)
+
+        # Show empty state if there is nothing to show
+        self.library_stack.set_visible_child_name("apps" if apps else "empty")
+
+    def _splice_app_batch(self, batches):
+        """Append the next batch of cards started by _populate_applications."""
+        batch = next(batches, None)
+        if batch is None:
+            self._populate_source_id = None
+            return GLib.SOURCE_REMOVE
+
+        self.app_store.splice(self.app_store.get_n_items(), 0,
+                              [_AppItem(app) for app in batch])
+        return GLib.SOURCE_CONTINUE
+
+    def _on_app_card_setup(self, factory, list_item):
+        """Create a reusable application card widget."""
+        # Stamp the card widget tree from the shared template
+        builder = Gtk.Builder.new_from_string(_CARD_UI, -1)
+        card = builder.get_object("card")
 
         # Button for clicking
-        button = Gtk.Button()
-        button.set_has_frame(False)
-        button.connect("clicked", self._on_app_card_clicked, app['id'])
+        button = builder.get_object("button")
+        button.connect("clicked", self._on_app_card_clicked, list_item)
+
+        # Store references for bind/unbind and right-click lookup
+        card.list_item = list_item
+        card.icon = builder.get_object("icon")
+        card.name_label = builder.get_object("name")
+        card.prefix_label = builder.get_object("prefix")
+        list_item.set_child(card)
+
+    def _on_app_card_bind(self, factory, list_item):
+        """Fill a recycled card with the application it now shows."""
+        item = list_item.get_item()
+        card = list_item.get_child()
+
+        # Icon with styled background: show the fallback now and swap in the
+        # real icon once it has been loaded in the background
+        card.icon.set_from_gicon(_themed_icon("application-x-executable-symbolic"))
+        if item.icon_ok:
+            self._icon_token += 1
+            card.icon_token = self._icon_token
+            card.icon_future = self._icon_executor.submit(
+                self._load_icon, item.icon_path, card, card.icon_token)
+
+        # Application name and prefix name (smaller text)
+        card.name_label.set_label(item.name)
+        card.prefix_label.set_label(item.prefix_name)
+
+    def _on_app_card_unbind(self, factory, list_item):
+        """Release the icon of a card scrolled out of view."""
+        card = list_item.get_child()
+
+        # Drop any icon load still pending for this card
+        future = getattr(card, 'icon_future', None)
+        if future is not None:
+            future.cancel()
+        card.icon_future = None
+        card.icon_token = None
+
+        card.icon.clear()
+
+    def _load_icon(self, path: str, card, token: int):
+        """Worker thread: get the texture for a card icon, decoding it if needed."""
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return
 
-        # Add right-click handler
-        right_click = Gtk.GestureClick.new()
-        right_click.set_button(3)  # Right mouse button
-        right_click.connect("pressed", self._on_app_card_right_clicked, app['id'])
-        button.add_controller(right_click)
-
-        button_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        button_box.set_spacing(8)
-        button_box.set_margin_top(12)
-        button_box.set_margin_bottom(12)
-        button_box.set_margin_start(12)
-        button_box.set_margin_end(12)
-        button.set_child(button_box)
-
-        # Icon with styled background
-        icon_box = Gtk.Box()
-        icon_box.set_halign(Gtk.Align.CENTER)
-        icon_box.add_css_class("app-icon")
-
-        if app['icon_path'] and os.path.isfile(app['icon_path']):
-            icon = Gtk.Image.new_from_file(app['icon_path'])
-        else:
-            icon = Gtk.Image.new_from_icon_name("application-x-executable-symbolic")
-        icon.set_pixel_size(64)
-        icon_box.append(icon)
-        button_box.append(icon_box)
+        key = (path, mtime, _ICON_SIZE)
+        with self._icon_cache_lock:
+            texture = self._icon_cache.get(key)
+            if texture is not None:
+                self._icon_cache.move_to_end(key)
+
+        if texture is None:
+            pixbuf = self._load_scaled_icon(path, mtime)
+            if pixbuf is None:
+                return
+            texture = Gdk.Texture.new_for_pixbuf(pixbuf)
+
+            with self._icon_cache_lock:
+                self._icon_cache[key] = texture
+                while len(self._icon_cache) > _ICON_CACHE_SIZE:
+                    self._icon_cache.popitem(last=False)
+
+        GLib.idle_add(self._on_icon_loaded, card, token, texture)
+
+    def _load_scaled_icon(self, path: str, mtime: float):
+        """Worker thread: decode an icon at card size, via the on-disk cache."""
+        digest = hashlib.md5(path.encode()).hexdigest()
+        cache_file = os.path.join(_ICON_DISK_CACHE, f"{digest}_{_ICON_SIZE}.png")
+
+        # Reuse the pre-scaled copy unless the source icon changed since
+        try:
+            if os.stat(cache_file).st_mtime >= mtime:
+                return GdkPixbuf.Pixbuf.new_from_file(cache_file)
+        except (OSError, GLib.Error):
+            pass
 
-        # Application name
-        name_label = Gtk.Label(label=app['name'])
-        name_label.set_wrap(True)
-        name_label.set_max_width_chars(20)
-        name_label.set_justify(Gtk.Justification.CENTER)
-        button_box.append(name_label)
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(path, _ICON_SIZE, _ICON_SIZE, True)
+        except GLib.Error as e:
+            logger.debug("Could not load icon %s: %s", path, e)
+            return None
 
-        # Prefix name (smaller text)
-        prefix_label = Gtk.Label(label=app['prefix_name'])
-        prefix_label.add_css_class("dim-label")
-        prefix_label.add_css_class("caption")
-        button_box.append(prefix_label)
+        try:
+            os.makedirs(_ICON_DISK_CACHE, exist_ok=True)
+            pixbuf.savev(cache_file, "png", [], [])
+        except (OSError, GLib.Error) as e:
+            logger.debug("Could not cache icon %s: %s", path, e)
 
-        card.append(button)
+        return pixbuf
 
-        return card
+    def _on_icon_loaded(self, card, token: int, texture):
+        """Show a loaded icon if the card still shows the app it was loaded for."""
+        if getattr(card, 'icon_token', None) == token:
+            card.icon.set_from_paintable(texture)
+        return False
 
-    def _on_app_card_clicked(self, button, app_id: int):
+    def _on_app_card_clicked(self, button, list_item):
         """Handle application card click."""
+        item = list_item.get_item()
+        if item is None:
+            return
+
         # Show app details dialog with launch button
-        self._show_app_dialog(app_id)
+        self._show_app_dialog(item.id)
 
-    def _on_app_card_right_clicked(self, gesture, n_press, x, y, app_id: int):
-        """Handle application card right-click - show context menu."""
-        app = self.app_launcher.get_application(app_id)
+    def _on_grid_right_clicked(self, gesture, n_press, x, y):
+        """Handle a right-click on the library grid - show the card's context menu."""
+        grid = self.app_grid_view
+
+        # Walk up from the picked widget to the card it belongs to
+        card = grid.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while card is not None and card is not grid and not hasattr(card, 'list_item'):
+            card = card.get_parent()
+        if card is None or card is grid:
+            return
+
+        item = card.list_item.get_item()
+        if item is None:
+            return
+
+        app_id = item.id
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
-        # Create context menu
-        menu = Gio.Menu()
-        menu.append("Open Install Directory", f"app.open-directory::{app_id}")
-        menu.append("Edit Launch Arguments", f"app.edit-arguments::{app_id}")
-        menu.append("Change Executable", f"app.change-executable::{app_id}")
-        menu.append("Manage Dependencies", f"app.manage-dependencies::{app_id}")
-        menu.append("Enable Controller Support", f"app.enable-controller::{app_id}")
-        menu.append("Remap Controller Buttons", f"app.remap-controller::{app_id}")
+        # Whatever action is picked next will want the prefix too
+        self._prefetch_for_menu(app)
 
         # Check if virtual desktop is currently enabled
-        vd_enabled = self.db.get_env_var(app_id, 'WINE_VIRTUAL_DESKTOP_ENABLED')
-        vd_label = "Disable Virtual Desktop" if vd_enabled == '1' else "Enable Virtual Desktop"
-        menu.append(vd_label, f"app.toggle-virtual-desktop::{app_id}")
-
-        # Create popover menu
-        popover = Gtk.PopoverMenu()
-        popover.set_menu_model(menu)
-        popover.set_parent(gesture.get_widget())
+        vd_enabled = self._get_env_cached(app_id).get('WINE_VIRTUAL_DESKTOP_ENABLED') == '1'
+
+        # Reuse one menu and popover for every card
+        if self._context_popover is None:
+            self._context_menu = Gio.Menu()
+            self._context_popover = Gtk.PopoverMenu.new_from_model(self._context_menu)
+
+        # Retarget the menu items only when a different app (or state) is shown
+        menu_key = (app_id, vd_enabled)
+        if menu_key != self._context_menu_key:
+            menu = self._context_menu
+            menu.remove_all()
+            for label, action in _CONTEXT_MENU_ITEMS:
+                menu.append(label, f"card.{action}::{app_id}")
+            vd_label = "Disable Virtual Desktop" if vd_enabled else "Enable Virtual Desktop"
+            menu.append(vd_label, f"card.toggle-virtual-desktop::{app_id}")
+            self._context_menu_key = menu_key
+
+        # Move the popover to the clicked card
+        popover = self._context_popover
+        if popover.get_parent() is not card:
+            if popover.get_parent() is not None:
+                popover.unparent()
+            popover.set_parent(card)
 
         # Position at click location
+        _, card_x, card_y = grid.translate_coordinates(card, x, y)
         rect = Gdk.Rectangle()
-        rect.x = x
-        rect.y = y
+        rect.x = int(card_x)
+        rect.y = int(card_y)
         rect.width = 1
         rect.height = 1
         popover.set_pointing_to(rect)
@@ -992,7 +1503,6 @@ class MainWindow(Adw.ApplicationWindow):
     def _open_directory(self, directory: str):
         """Open a directory in the file manager."""
         try:
-            import subprocess
             subprocess.Popen(['xdg-open', directory])
             logger.info(f"Opened directory: {directory}")
         except Exception as e:
@@ -1001,7 +1511,7 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _show_app_dialog(self, app_id: int):
         """Show application details dialog."""
-        app = self.app_launcher.get_application(app_id)
+        app = self._get_app_cached(app_id)
         if not app:
             return
 
@@ -1017,39 +1527,36 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.set_response_appearance("launch", Adw.ResponseAppearance.SUGGESTED)
         dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
 
-        dialog.connect("response", self._on_app_dialog_response, app_id)
+        dialog.connect("response", self._on_app_dialog_response, app)
         dialog.present()
 
-    def _on_app_dialog_response(self, dialog, response, app_id: int):
+    def _on_app_dialog_response(self, dialog, response, app: dict):
         """Handle app dialog response."""
         if response == "launch":
-            self._launch_application(app_id)
+            self._launch_application(app)
         elif response == "remove":
-            self._remove_application(app_id)
+            self._remove_application(app)
         elif response == "shortcut":
-            self._create_desktop_shortcut(app_id)
+            self._create_desktop_shortcut(app)
         elif response == "prefix":
             # Open Wine C: drive for this app's prefix
-            app = self.app_launcher.get_application(app_id)
-            if app and app.get('prefix_path'):
+            if app.get('prefix_path'):
                 drive_c = os.path.join(app['prefix_path'], 'drive_c')
                 if os.path.exists(drive_c):
                     self._open_directory(drive_c)
 
-    def _launch_application(self, app_id: int):
+    def _launch_application(self, app: dict):
         """Launch an application."""
-        app = self.app_launcher.get_application(app_id)
-        if not app:
-            return
-
         # Show launching toast
         toast = Adw.Toast.new(f"Launching {app['name']}...")
         toast.set_timeout(2)
         self.toast_overlay.add_toast(toast)
 
-        # Launch in background thread
+        # Launch in background thread. AppLauncher.launch probes the audio
+        # stack and writes the log header before Popen returns, so it cannot
+        # run on the main loop; the result is posted back as a one-shot idle.
         def launch_thread():
-            success, message, process = self.app_launcher.launch(app_id)
+            success, message, process = self.app_launcher.launch(app['id'], app)
 
             GLib.idle_add(self._on_launch_complete, success, message, app['name'])
 
@@ -1064,68 +1571,60 @@ class MainWindow(Adw.ApplicationWindow):
             toast = Adw.Toast.new(f"Failed to launch {app_name}: {message}")
         toast.set_timeout(3)
         self.toast_overlay.add_toast(toast)
+        return GLib.SOURCE_REMOVE
 
-    def _remove_application(self, app_id: int):
-        """Remove an application - show dialog to ask about deleting files."""
-        app = self.app_launcher.get_application(app_id)
-        if not app:
-            return
-
+    def _remove_application(self, app: dict):
+        """Remove an application - ask whether to delete its files as well."""
         # Create confirmation dialog
         dialog = Adw.MessageDialog.new(self)
         dialog.set_heading(f"Remove {app['name']}?")
-        dialog.set_body("Do you want to delete the application files or just remove it from the library?")
+        dialog.set_body("The application will be removed from the library.")
 
         dialog.add_response("cancel", "Cancel")
-        dialog.add_response("remove-only", "Remove from Library Only")
-        dialog.add_response("delete-files", "Remove and Delete Files")
-
-        dialog.set_response_appearance("remove-only", Adw.ResponseAppearance.SUGGESTED)
-        dialog.set_response_appearance("delete-files", Adw.ResponseAppearance.DESTRUCTIVE)
+        dialog.add_response("remove", "Remove")
+        dialog.set_response_appearance("remove", Adw.ResponseAppearance.SUGGESTED)
 
-        dialog.connect("response", self._on_remove_dialog_response, app_id)
+        # Opt-in to deleting the install directory, naming it so the user
+        # confirms exactly what goes away
+        exe_path = app.get('executable_path', '')
+        exe_dir = os.path.dirname(exe_path) if exe_path and os.path.exists(exe_path) else None
+        dialog.delete_check = None
+        if exe_dir:
+            check = Gtk.CheckButton(
+                label=f"Also delete {exe_dir}\n(this cannot be undone)")
+            check.connect("toggled", self._on_remove_delete_toggled, dialog)
+            dialog.set_extra_child(check)
+            dialog.delete_check = check
+
+        dialog.connect("response", self._on_remove_dialog_response, app, exe_dir)
         dialog.present()
 
-    def _on_remove_dialog_response(self, dialog, response, app_id: int):
-        """Handle remove confirmation dialog response."""
-        if response == "cancel":
-            return
+    def _on_remove_delete_toggled(self, check, dialog):
+        """Mark the remove response destructive while file deletion is ticked."""
+        if check.get_active():
+            dialog.set_response_label("remove", "Remove and Delete Files")
+            dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
+        else:
+            dialog.set_response_label("remove", "Remove")
+            dialog.set_response_appearance("remove", Adw.ResponseAppearance.SUGGESTED)
 
-        app = self.app_launcher.get_application(app_id)
-        if not app:
+    def _on_remove_dialog_response(self, dialog, response, app: dict, exe_dir: Optional[str]):
+        """Handle remove confirmation dialog response."""
+        if response != "remove":
             return
 
-        delete_files = (response == "delete-files")
+        delete_files = dialog.delete_check is not None and dialog.delete_check.get_active()
 
         # Remove from database
-        success, message = self.app_launcher.remove_application(app_id)
+        success, message = self.app_launcher.remove_application(app['id'], app)
+        self._invalidate_app_cache(app['id'])
 
         if success:
-            # If user wants to delete files, delete the executable and its directory
+            # If user wants to delete files, delete the executable's directory
             if delete_files:
-                try:
-                    exe_path = app.get('executable_path', '')
-                    if exe_path and os.path.exists(exe_path):
-                        exe_dir = os.path.dirname(exe_path)
-
-                        # Ask for final confirmation before deleting
-                        confirm_dialog = Adw.MessageDialog.new(self)
-                        confirm_dialog.set_heading("Delete Files?")
-                        confirm_dialog.set_body(f"This will permanently delete:\n{exe_dir}\n\nThis cannot be undone!")
-                        confirm_dialog.add_response("cancel", "Cancel")
-                        confirm_dialog.add_response("delete", "Delete Files")
-                        confirm_dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
-                        confirm_dialog.connect("response", self._on_delete_files_response, exe_dir, app['name'])
-                        confirm_dialog.present()
-                    else:
-                        logger.warning(f"Executable path not found for deletion: {exe_path}")
-                except Exception as e:
-                    logger.error(f"Error preparing file deletion: {e}", exc_info=True)
-                    toast = Adw.Toast.new(f"Error: {str(e)}")
-                    toast.set_timeout(3)
-                    self.toast_overlay.add_toast(toast)
+                self._delete_app_files(exe_dir, app['name'])
 
-            self._refresh_applications()
+            self._request_refresh()
             toast = Adw.Toast.new(f"Removed {app['name']} from library")
         else:
             toast = Adw.Toast.new(f"Error: {message}")
@@ -1133,23 +1632,42 @@ class MainWindow(Adw.ApplicationWindow):
         toast.set_timeout(2)
         self.toast_overlay.add_toast(toast)
 
-    def _on_delete_files_response(self, dialog, response, directory: str, app_name: str):
-        """Handle final delete files confirmation."""
-        if response == "delete":
-            try:
-                import shutil
-                if os.path.exists(directory):
-                    shutil.rmtree(directory)
-                    logger.info(f"Deleted directory: {directory}")
-                    toast = Adw.Toast.new(f"Deleted files for {app_name}")
+    def _delete_app_files(self, directory: str, app_name: str):
+        """Delete an application's install directory in the background."""
+        toast = Adw.Toast.new(f"Deleting files for {app_name}...")
+        toast.set_timeout(2)
+        self.toast_overlay.add_toast(toast)
+
+        # Game directories can be many GB, so rmtree must not run on the
+        # main loop; the outcome is posted back as a one-shot idle.
+        def delete_thread():
+            errors = []
+
+            def on_error(func, path, exc_info):
+                errors.append(path)
+                logger.warning(f"Could not delete {path}: {exc_info[1]}")
+
+            if os.path.exists(directory):
+                shutil.rmtree(directory, onerror=on_error)
+                if errors:
+                    message = f"Could not delete {len(errors)} file(s) for {app_name}"
                 else:
-                    toast = Adw.Toast.new(f"Directory not found: {directory}")
-            except Exception as e:
-                logger.error(f"Error deleting directory: {e}", exc_info=True)
-                toast = Adw.Toast.new(f"Error deleting files: {str(e)}")
+                    logger.info(f"Deleted directory: {directory}")
+                    message = f"Deleted files for {app_name}"
+            else:
+                message = f"Directory not found: {directory}"
 
-            toast.set_timeout(3)
-            self.toast_overlay.add_toast(toast)
+            GLib.idle_add(self._on_app_files_deleted, message)
+
+        thread = threading.Thread(target=delete_thread, daemon=True)
+        thread.start()
+
+    def _on_app_files_deleted(self, message: str):
+        """Report the outcome of _delete_app_files."""
+        toast = Adw.Toast.new(message)
+        toast.set_timeout(3)
+        self.toast_overlay.add_toast(toast)
+        return GLib.SOURCE_REMOVE
 
     def _on_add_app_clicked(self, button):
         """Handle add application button click."""
@@ -1167,7 +1685,8 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _on_app_added(self, dialog):
         """Handle application added event."""
-        self._refresh_applications()
+        self._invalidate_app_cache()
+        self._request_refresh()
 
     def _show_error_dialog(self, title: str, message: str):
         """Show an error dialog."""
@@ -1177,28 +1696,17 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.add_response("ok", "OK")
         dialog.present()
 
-    def _create_desktop_shortcut(self, app_id: int):
+    def _create_desktop_shortcut(self, app: dict):
         """Create a desktop shortcut for an application."""
-        app = self.app_launcher.get_application(app_id)
-        if not app:
-            return
-
         try:
-            # Desktop directory (where user can see the icon)
-            desktop_dir = os.path.expanduser('~/Desktop')
-            os.makedirs(desktop_dir, exist_ok=True)
+            # Make sure the desktop directory exists (once per session)
+            if not self._desktop_dir_ready:
+                os.makedirs(_DESKTOP_DIR, exist_ok=True)
+                self._desktop_dir_ready = True
 
             # Sanitize app name for filename
-            safe_name = "".join(c for c in app['name'] if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_name = safe_name.replace(' ', '-')
-            desktop_file = os.path.join(desktop_dir, f'winetranslator-{safe_name}.desktop')
-
-            # Check if shortcut already exists
-            if os.path.exists(desktop_file):
-                toast = Adw.Toast.new(f"Desktop shortcut already exists for {app['name']}")
-                toast.set_timeout(3)
-                self.toast_overlay.add_toast(toast)
-                return
+            safe_name = _SANITIZE_RE.sub('', app['name']).strip().replace(' ', '-')
+            desktop_file = os.path.join(_DESKTOP_DIR, f'winetranslator-{safe_name}.desktop')
 
             # Create .desktop file content
             desktop_content = f"""[Desktop Entry]
@@ -1206,18 +1714,24 @@ Version=1.0
 Type=Application
 Name={app['name']}
 Comment=Launch {app['name']} with WineTranslator
-Exec=winetranslator-launch {app_id}
+Exec=winetranslator-launch {app['id']}
 Icon=application-x-executable
 Terminal=false
 Categories=Wine;
 """
 
-            # Write .desktop file
-            with open(desktop_file, 'w') as f:
-                f.write(desktop_content)
+            # Create the executable .desktop file in one go; O_EXCL doubles as
+            # the check for an existing shortcut
+            try:
+                fd = os.open(desktop_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o755)
+            except FileExistsError:
+                toast = Adw.Toast.new(f"Desktop shortcut already exists for {app['name']}")
+                toast.set_timeout(3)
+                self.toast_overlay.add_toast(toast)
+                return
 
-            # Make executable
-            os.chmod(desktop_file, 0o755)
+            with os.fdopen(fd, 'w') as f:
+                f.write(desktop_content)
 
             logger.info(f"Created desktop shortcut: {desktop_file}")
 
@@ -13,6 +13,11 @@ from ..database.db import Database
 
 logger = logging.getLogger(__name__)
 
+# Default locations shown when the settings are empty
+_DATA_HOME = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
+_DEFAULT_CACHE_PATH = os.path.join(_DATA_HOME, 'winetranslator', 'dep_cache')
+_DEFAULT_STORAGE_PATH = os.path.join(_DATA_HOME, 'winetranslator', 'prefixes')
+
 
 class PreferencesDialog(Adw.PreferencesWindow):
     """Preferences dialog for WineTranslator settings."""
@@ -26,6 +31,11 @@ class PreferencesDialog(Adw.PreferencesWindow):
 
         self.db = db
 
+        # Setting writes waiting for the debounce timer (see _set_setting)
+        self._pending_settings = {}
+        self._flush_source_id = None
+        self.connect("close-request", self._on_close_request)
+
         self._build_ui()
         self._load_settings()
 
@@ -137,34 +147,61 @@ class PreferencesDialog(Adw.PreferencesWindow):
 
     def _load_settings(self):
         """Load settings from database."""
+        settings = self.db.get_all_settings()
+
         # Load cache enabled setting
-        cache_enabled = self.db.get_setting('cache_dependencies', '0') == '1'
+        cache_enabled = settings.get('cache_dependencies', '0') == '1'
         self.cache_switch_row.set_active(cache_enabled)
 
         # Load cache path
-        cache_path = self.db.get_setting('cache_path', '')
+        cache_path = settings.get('cache_path', '')
         if not cache_path:
             # Set default cache path
-            data_home = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
-            cache_path = os.path.join(data_home, 'winetranslator', 'dep_cache')
+            cache_path = _DEFAULT_CACHE_PATH
 
         self.cache_path_label.set_text(cache_path)
         self._update_cache_ui()
 
         # Load large address aware setting (default to enabled)
-        large_address = self.db.get_setting('wine_large_address', '1') == '1'
+        large_address = settings.get('wine_large_address', '1') == '1'
         self.large_address_row.set_active(large_address)
 
         # Load storage location
-        storage_location = self.db.get_setting('prefix_storage_location', '')
+        storage_location = settings.get('prefix_storage_location', '')
         if not storage_location:
             # Show default location
-            data_home = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
-            storage_location = os.path.join(data_home, 'winetranslator', 'prefixes')
+            storage_location = _DEFAULT_STORAGE_PATH
             self.storage_path_label.set_text(f"{storage_location} (default)")
         else:
             self.storage_path_label.set_text(storage_location)
 
+    def _get_setting(self, key: str, default: str = None):
+        """Get a setting value, including writes not yet flushed."""
+        if key in self._pending_settings:
+            return self._pending_settings[key]
+        return self.db.get_setting(key, default)
+
+    def _set_setting(self, key: str, value: str):
+        """Queue a setting write; rapid changes are coalesced into one transaction."""
+        self._pending_settings[key] = value
+        if self._flush_source_id is None:
+            self._flush_source_id = GLib.timeout_add(300, self._flush_settings)
+
+    def _flush_settings(self):
+        """Write all queued settings to the database."""
+        self._flush_source_id = None
+        if self._pending_settings:
+            self.db.set_settings(self._pending_settings)
+            self._pending_settings = {}
+        return GLib.SOURCE_REMOVE
+
+    def _on_close_request(self, window):
+        """Flush queued settings before the dialog closes."""
+        if self._flush_source_id is not None:
+            GLib.source_remove(self._flush_source_id)
+        self._flush_settings()
+        return False
+
     def _update_cache_ui(self):
         """Update cache UI based on enabled state."""
         enabled = self.cache_switch_row.get_active()
@@ -176,15 +213,14 @@ class PreferencesDialog(Adw.PreferencesWindow):
         enabled = switch.get_active()
         logger.info(f"Cache dependencies toggled: {enabled}")
 
-        self.db.set_setting('cache_dependencies', '1' if enabled else '0')
+        self._set_setting('cache_dependencies', '1' if enabled else '0')
 
         # If enabling and no path set, set default
         if enabled:
-            cache_path = self.db.get_setting('cache_path', '')
+            cache_path = self._get_setting('cache_path', '')
             if not cache_path:
-                data_home = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
-                cache_path = os.path.join(data_home, 'winetranslator', 'dep_cache')
-                self.db.set_setting('cache_path', cache_path)
+                cache_path = _DEFAULT_CACHE_PATH
+                self._set_setting('cache_path', cache_path)
                 self.cache_path_label.set_text(cache_path)
 
                 # Create cache directory
@@ -227,7 +263,7 @@ class PreferencesDialog(Adw.PreferencesWindow):
                 os.makedirs(cache_path, exist_ok=True)
 
                 # Save to database
-                self.db.set_setting('cache_path', cache_path)
+                self._set_setting('cache_path', cache_path)
                 self.cache_path_label.set_text(cache_path)
                 logger.info(f"Cache path saved to database: {cache_path}")
             else:
@@ -246,7 +282,7 @@ class PreferencesDialog(Adw.PreferencesWindow):
         """Handle large address aware toggle."""
         enabled = switch.get_active()
         logger.info(f"Wine large address aware toggled: {enabled}")
-        self.db.set_setting('wine_large_address', '1' if enabled else '0')
+        self._set_setting('wine_large_address', '1' if enabled else '0')
 
     def _on_choose_storage_location(self, button):
         """Handle choose storage location button click."""
@@ -256,10 +292,9 @@ class PreferencesDialog(Adw.PreferencesWindow):
         dialog.set_title("Select Prefix Storage Location")
 
         # Set initial folder
-        current_path = self.db.get_setting('prefix_storage_location', '')
+        current_path = self._get_setting('prefix_storage_location', '')
         if not current_path:
-            data_home = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
-            current_path = os.path.join(data_home, 'winetranslator', 'prefixes')
+            current_path = _DEFAULT_STORAGE_PATH
 
         logger.info(f"Current storage path: {current_path}")
 
@@ -286,7 +321,7 @@ class PreferencesDialog(Adw.PreferencesWindow):
                 os.makedirs(storage_path, exist_ok=True)
 
                 # Save to database
-                self.db.set_setting('prefix_storage_location', storage_path)
+                self._set_setting('prefix_storage_location', storage_path)
                 self.storage_path_label.set_text(storage_path)
                 logger.info(f"Storage path saved to database: {storage_path}")
 
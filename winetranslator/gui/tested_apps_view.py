@@ -7,14 +7,29 @@ Shows curated list of tested Windows applications.
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-from gi.repository import Gtk, Adw, GLib, Gio
+gi.require_version('Pango', '1.0')
+gi.require_version('Gdk', '4.0')
+from gi.repository import Gtk, Adw, Gdk, GLib, Gio, GObject, Pango
+import gzip
 import os
+import sys
+import urllib.error
 import urllib.request
 import threading
 import logging
 import json
+from contextlib import contextmanager
+from pathlib import Path
+
+# urllib3 (optional) keeps connections alive between installer downloads;
+# without it every download opens a fresh connection through urllib
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
 
 from ..database.db import Database
+from ..core.app_launcher import AppLauncher
 from ..core.runner_manager import RunnerManager
 from ..core.prefix_manager import PrefixManager
 from ..core.dependency_manager import DependencyManager
@@ -24,6 +39,56 @@ logger = logging.getLogger(__name__)
 # GitHub URL for tested apps database
 TESTED_APPS_URL = "https://raw.githubusercontent.com/crucifix86/winetranslator/main/tested_apps.json"
 
+# Tested app row UI template, parsed by Gtk.Builder for each recycled row
+_ROW_UI = (Path(__file__).parent / "tested_app_card.ui").read_text()
+
+
+class _ProgressUpdater:
+    """Posts progress dialog text from a worker thread, coalescing bursts."""
+
+    def __init__(self, dialog):
+        self._dialog = dialog
+        self._lock = threading.Lock()
+        self._text = None
+        self._pending = False
+
+    def __call__(self, text: str):
+        # At most one idle is queued; it shows whatever text is latest when
+        # it runs, so bursts cost one wakeup and the last message still lands
+        with self._lock:
+            self._text = text
+            if self._pending:
+                return
+            self._pending = True
+        GLib.idle_add(self._flush)
+
+    def _flush(self):
+        with self._lock:
+            text = self._text
+            self._pending = False
+        self._dialog.set_body(text)
+        return False
+
+
+class _TestedAppItem(GObject.Object):
+    """List model item for an entry in the tested apps list."""
+
+    name = GObject.Property(type=str)
+    version = GObject.Property(type=str)
+    category = GObject.Property(type=str)
+    description = GObject.Property(type=str)
+    install_notes = GObject.Property(type=str)
+    installation_type = GObject.Property(type=str)
+    installed = GObject.Property(type=bool, default=False)
+
+    def __init__(self, app: dict):
+        super().__init__(name=app['name'], version=app['version'],
+                         category=app['category'], description=app['description'],
+                         install_notes=app.get('install_notes') or '',
+                         installation_type=app.get('installation_type', 'download'))
+        # Raw entry, handed to the install handlers
+        self.app = app
+
 
 class TestedAppsView(Gtk.Box):
     """View for browsing and installing tested applications."""
@@ -36,13 +101,34 @@ class TestedAppsView(Gtk.Box):
         self.runner_manager = runner_manager
         self.prefix_manager = prefix_manager
         self.dep_manager = dep_manager
+        self._launcher = AppLauncher(db)
+
+        # Shared connection pool for installer downloads (see _open_download)
+        self._http = urllib3.PoolManager(num_pools=4, maxsize=8) if urllib3 else None
+
+        # Lowercased library app names (None until read, see _get_installed_names)
+        self._installed_names = None
+
+        # Warning icon for install notes, looked up once and shared by all rows
+        icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
+        self._warning_paintable = icon_theme.lookup_icon(
+            "dialog-warning-symbolic", None, 16, 1, Gtk.TextDirection.NONE, 0)
 
         # Initialize data
         self.tested_apps = []
+        # List items for tested_apps, built once per fetch (see _on_apps_loaded)
+        self._items = []
         self.categories = ['All']
         self.cache_path = os.path.join(
             os.path.expanduser('~/.local/share/winetranslator'),
-            'tested_apps_cache.json'
+            'tested_apps_cache.json.gz'
+        )
+        # Uncompressed cache written by older versions, still read as a fallback
+        self.legacy_cache_path = self.cache_path[:-len('.gz')]
+        # ETag / Last-Modified of the cached copy, for conditional fetches
+        self.cache_meta_path = os.path.join(
+            os.path.dirname(self.cache_path),
+            'tested_apps_cache.meta.json'
         )
 
         self._build_ui()
@@ -72,213 +158,277 @@ class TestedAppsView(Gtk.Box):
         refresh_button.connect("clicked", self._on_refresh_clicked)
         toolbar.pack_end(refresh_button)
 
+        # Stack switching between the apps list and the empty state
+        self.apps_stack = Gtk.Stack()
+        self.apps_stack.set_vexpand(True)
+        self.append(self.apps_stack)
+
         # Scrolled window for apps list
         scrolled = Gtk.ScrolledWindow()
-        scrolled.set_vexpand(True)
-        self.append(scrolled)
-
-        # Apps list box
-        self.apps_list = Gtk.ListBox()
-        self.apps_list.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.apps_stack.add_named(scrolled, "list")
+
+        # Apps list view; only visible rows are realized and row widgets
+        # are recycled as the user scrolls. Each category has its own
+        # prebuilt store (see _load_apps), so switching is a model swap.
+        self.category = 'All'
+        # Pending category switch (see _on_category_changed)
+        self._category_source_id = None
+        self.category_stores = {}
+        self.selection = Gtk.NoSelection.new(Gio.ListStore.new(_TestedAppItem))
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_app_row_setup)
+        factory.connect("bind", self._on_app_row_bind)
+
+        self.apps_list = Gtk.ListView(model=self.selection, factory=factory)
         self.apps_list.add_css_class("boxed-list")
 
-        # Clamp for better width
-        clamp = Adw.Clamp()
+        # Clamp for better width (scrollable variant keeps the view virtualized)
+        clamp = Adw.ClampScrollable()
         clamp.set_maximum_size(1200)
         clamp.set_child(self.apps_list)
         scrolled.set_child(clamp)
 
+        # Empty state
+        empty_label = Gtk.Label(label="No tested apps available.\nClick refresh to reload.")
+        empty_label.set_margin_top(48)
+        empty_label.set_margin_bottom(48)
+        empty_label.set_valign(Gtk.Align.START)
+        empty_label.add_css_class("dim-label")
+        self.apps_stack.add_named(empty_label, "empty")
+
         # Don't load apps here - wait for fetch to complete
-        # The empty state will show until data is fetched
+        # The list stays empty until data is fetched
 
-    def _load_apps(self, category='All'):
+    def _load_apps(self):
         """Load tested apps into the list."""
-        logger.info(f"_load_apps called with category={category}")
         logger.info(f"Total tested apps available: {len(self.tested_apps)}")
 
-        # Clear existing
-        logger.info("Clearing existing rows")
-        removed_count = 0
-        while True:
-            row = self.apps_list.get_row_at_index(0)
-            if row is None:
-                break
-            self.apps_list.remove(row)
-            removed_count += 1
-        logger.info(f"Removed {removed_count} rows")
-
-        # Filter by category
-        apps = self.tested_apps
-        if category != 'All':
-            apps = [app for app in self.tested_apps if app.get('category') == category]
-
-        logger.info(f"Apps to display after filtering: {len(apps)}")
-
-        # Add app cards
-        if not apps:
-            # Show empty state
-            logger.warning("No apps to display, showing empty state")
-            empty_label = Gtk.Label(label="No tested apps available.\nClick refresh to reload.")
-            empty_label.set_margin_top(48)
-            empty_label.set_margin_bottom(48)
-            empty_label.add_css_class("dim-label")
-            row = Gtk.ListBoxRow()
-            row.set_selectable(False)
-            row.set_activatable(False)
-            row.set_child(empty_label)
-            self.apps_list.append(row)
-        else:
-            logger.info(f"Creating cards for {len(apps)} apps")
-            for app in apps:
-                logger.info(f"Creating card for: {app.get('name', 'Unknown')}")
-                try:
-                    card = self._create_app_card(app)
-                    self.apps_list.append(card)
-                    card.set_visible(True)  # Explicitly make visible
-                    logger.info(f"Card added successfully for {app.get('name')}")
-                except Exception as e:
-                    logger.error(f"Error creating card for {app.get('name')}: {e}", exc_info=True)
-
-            # Force the list to update
-            self.apps_list.queue_draw()
-
-    def _create_app_card(self, app):
-        """Create a card for a tested app."""
-        row = Gtk.ListBoxRow()
-        row.set_selectable(False)
-        row.set_activatable(False)
-
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        box.set_spacing(12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
-        row.set_child(box)
-
-        # Header with name and install button
-        header = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        header.set_spacing(12)
-        box.append(header)
-
-        # App info
-        info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
-        info_box.set_spacing(4)
-        info_box.set_hexpand(True)
-        header.append(info_box)
-
-        # Name and version
-        name_label = Gtk.Label()
-        name_label.set_markup(f"<b>{app['name']}</b> {app['version']}")
-        name_label.set_halign(Gtk.Align.START)
-        info_box.append(name_label)
-
-        # Category badge
-        category_label = Gtk.Label(label=app['category'])
-        category_label.set_halign(Gtk.Align.START)
-        category_label.add_css_class("dim-label")
-        category_label.add_css_class("caption")
-        info_box.append(category_label)
-
-        # Check if already installed
-        is_installed = self._is_app_installed(app['name'])
+        # Read the library once for all entries
+        installed_names = self._get_installed_names()
+
+        # Only the installed state changes between reloads; the items
+        # themselves are reused
+        for item in self._items:
+            item.installed = self._is_app_installed(item.name, installed_names)
+
+        # Index the items by category once, so a category switch is a lookup
+        by_category = {'All': self._items}
+        for item in self._items:
+            by_category.setdefault(item.category, []).append(item)
+
+        self.category_stores = {}
+        for category, category_items in by_category.items():
+            store = Gio.ListStore.new(_TestedAppItem)
+            store.splice(0, 0, category_items)
+            self.category_stores[category] = store
+
+        self._show_category()
+
+    def _show_category(self):
+        """Point the list at the store of the selected category."""
+        store = self.category_stores.get(self.category)
+        if store is None:
+            store = Gio.ListStore.new(_TestedAppItem)
+        self.selection.set_model(store)
+
+        # Show the empty state when no apps match the category
+        has_apps = store.get_n_items() > 0
+        self.apps_stack.set_visible_child_name("list" if has_apps else "empty")
+
+    def _on_app_row_setup(self, factory, list_item):
+        """Create a reusable row widget for a tested app."""
+        # Stamp the row widget tree from the shared template
+        builder = Gtk.Builder.new_from_string(_ROW_UI, -1)
+        box = builder.get_object("row")
 
         # Install button
-        if is_installed:
-            install_button = Gtk.Button(label="Installed")
-            install_button.set_sensitive(False)
-            install_button.set_valign(Gtk.Align.CENTER)
+        box.install_button = builder.get_object("install_button")
+        box.install_button.connect("clicked", self._on_install_button_clicked, list_item)
+
+        # Install notes (warning)
+        builder.get_object("warning_icon").set_from_paintable(self._warning_paintable)
+
+        # Store references for bind
+        box.name_label = builder.get_object("name_label")
+        box.category_label = builder.get_object("category_label")
+        box.desc_label = builder.get_object("desc_label")
+        box.notes_box = builder.get_object("notes_box")
+        box.notes_label = builder.get_object("notes_label")
+
+        # Name attributes are built once per row; bind only moves the boundary
+        # between the bold name and the normal-weight version after it
+        box.name_bold = Pango.attr_weight_new(Pango.Weight.BOLD)
+        box.name_bold.start_index = 0
+        box.name_normal = Pango.attr_weight_new(Pango.Weight.NORMAL)
+        box.name_normal.end_index = Pango.ATTR_INDEX_TO_TEXT_END
+        box.name_attrs = Pango.AttrList()
+        list_item.set_child(box)
+
+    def _on_app_row_bind(self, factory, list_item):
+        """Fill a recycled row with the tested app it now shows."""
+        item = list_item.get_item()
+        box = list_item.get_child()
+
+        # Bold the name with a plain attribute instead of parsing markup;
+        # change() replaces whatever weight the previous item left behind
+        name_end = len(item.name.encode('utf-8'))
+        box.name_bold.end_index = name_end
+        box.name_normal.start_index = name_end
+        box.name_attrs.change(box.name_bold)
+        box.name_attrs.change(box.name_normal)
+        box.name_label.set_text(f"{item.name} {item.version}")
+        box.name_label.set_attributes(box.name_attrs)
+        box.category_label.set_label(item.category)
+        box.desc_label.set_label(item.description)
+
+        # Install button
+        button = box.install_button
+        if item.installed:
+            button.set_label("Installed")
+            button.set_sensitive(False)
+            button.remove_css_class("suggested-action")
         else:
             # Check installation type
-            installation_type = app.get('installation_type', 'download')
-            if installation_type == 'container':
-                install_button = Gtk.Button(label="Setup Container")
+            if item.installation_type == 'container':
+                button.set_label("Setup Container")
             else:
-                install_button = Gtk.Button(label="Download & Install")
-            install_button.add_css_class("suggested-action")
-            install_button.set_valign(Gtk.Align.CENTER)
-            install_button.connect("clicked", self._on_install_clicked, app)
-        header.append(install_button)
-
-        # Description
-        desc_label = Gtk.Label(label=app['description'])
-        desc_label.set_wrap(True)
-        desc_label.set_halign(Gtk.Align.START)
-        desc_label.set_margin_top(4)
-        box.append(desc_label)
-
-        # Install notes (warning)
-        if app.get('install_notes'):
-            notes_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-            notes_box.set_spacing(8)
-            notes_box.set_margin_top(8)
-            notes_box.add_css_class("warning")
-            box.append(notes_box)
+                button.set_label("Download & Install")
+            button.set_sensitive(True)
+            button.add_css_class("suggested-action")
+
+        # Install notes (warning); the styling is only applied to rows that
+        # show notes, so hidden boxes stay out of the style cascade
+        if item.install_notes:
+            box.notes_box.add_css_class("warning")
+            box.notes_label.set_label(item.install_notes)
+            box.notes_box.set_visible(True)
+        else:
+            box.notes_box.set_visible(False)
+            box.notes_box.remove_css_class("warning")
+
+    def _on_install_button_clicked(self, button, list_item):
+        """Handle a row's install button click."""
+        item = list_item.get_item()
+        if item is not None:
+            self._on_install_clicked(button, item.app)
+
+    def _get_installed_names(self):
+        """Get the lowercased names of all apps in the library."""
+        if self._installed_names is None:
+            self._installed_names = self._read_installed_names()
+        return self._installed_names
+
+    def _read_installed_names(self):
+        """Read the lowercased library app names from the database."""
+        try:
+            return [app['name'].lower() for app in self._launcher.get_all_applications()]
+        except Exception as e:
+            logger.error(f"Error checking installed apps: {e}")
+            return []
 
-            warning_icon = Gtk.Image.new_from_icon_name("dialog-warning-symbolic")
-            notes_box.append(warning_icon)
+    def _invalidate_installed_names(self):
+        """Re-read the library names after an install and refresh the buttons."""
+        def read_thread():
+            GLib.idle_add(self._on_installed_names_read, self._read_installed_names())
 
-            notes_label = Gtk.Label(label=app['install_notes'])
-            notes_label.set_wrap(True)
-            notes_label.set_halign(Gtk.Align.START)
-            notes_label.set_hexpand(True)
-            notes_box.append(notes_label)
+        thread = threading.Thread(target=read_thread, daemon=True)
+        thread.start()
 
-        return row
+    def _on_installed_names_read(self, installed_names):
+        """Apply library names read in the background."""
+        self._installed_names = installed_names
+        if self.tested_apps:
+            self._load_apps()
+        return False
 
-    def _is_app_installed(self, app_name):
+    def _is_app_installed(self, app_name, installed_names):
         """Check if an app is already installed in the library."""
-        try:
-            # Check database for apps with matching name
-            from ..core.app_launcher import AppLauncher
-            launcher = AppLauncher(self.db)
-            all_apps = launcher.get_all_applications()
-
-            for installed_app in all_apps:
-                if app_name.lower() in installed_app['name'].lower():
-                    return True
-            return False
-        except Exception as e:
-            logger.error(f"Error checking if app is installed: {e}")
-            return False
+        app_name = app_name.lower()
+        return any(app_name in name for name in installed_names)
 
     def _on_category_changed(self, dropdown, param):
         """Handle category filter change."""
         selected = dropdown.get_selected()
-        category = self.categories[selected] if selected < len(self.categories) else 'All'
-        self._load_apps(category)
+        self.category = self.categories[selected] if selected < len(self.categories) else 'All'
+
+        # Rapid changes (keyboard traversal) only switch the list once
+        if self._category_source_id is not None:
+            GLib.source_remove(self._category_source_id)
+        self._category_source_id = GLib.timeout_add(50, self._on_category_timeout)
+
+    def _on_category_timeout(self):
+        """Show the category selected when the debounce timer expires."""
+        self._category_source_id = None
+        self._show_category()
+        return GLib.SOURCE_REMOVE
 
     def _on_refresh_clicked(self, button):
         """Handle refresh button click."""
         logger.info("Refreshing tested apps list")
+        self._installed_names = None
         self._fetch_tested_apps()
 
     def _fetch_tested_apps(self):
         """Fetch tested apps from GitHub in background."""
         def fetch_thread():
+            # Resolve the library names here too, so loading the list on the
+            # main loop doesn't have to query the database
+            installed_names = self._read_installed_names()
+
+            # Only ask for the list if it changed since the cached copy
+            headers = {}
+            if os.path.exists(self.cache_path):
+                meta = self._load_cache_meta()
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+
             try:
                 logger.info(f"Fetching tested apps from {TESTED_APPS_URL}")
-                with urllib.request.urlopen(TESTED_APPS_URL, timeout=10) as response:
-                    data = json.loads(response.read().decode())
+                request = urllib.request.Request(TESTED_APPS_URL, headers=headers)
+                with urllib.request.urlopen(request, timeout=10) as response:
+                    data = json.load(response)
                     logger.info(f"Successfully fetched tested apps: {len(data.get('apps', []))} apps")
 
                     # Save to cache
-                    self._save_cache(data)
+                    self._save_cache(data, response.headers)
 
                     # Update UI on main thread
-                    GLib.idle_add(self._on_apps_loaded, data)
+                    GLib.idle_add(self._on_apps_loaded, data, installed_names)
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    logger.info("Tested apps list unchanged, using cache")
+                else:
+                    logger.warning(f"Failed to fetch from GitHub: {e}. Loading from cache...")
+                GLib.idle_add(self._load_from_cache, installed_names)
             except Exception as e:
                 logger.warning(f"Failed to fetch from GitHub: {e}. Loading from cache...")
                 # Try to load from cache
-                GLib.idle_add(self._load_from_cache)
+                GLib.idle_add(self._load_from_cache, installed_names)
 
         thread = threading.Thread(target=fetch_thread, daemon=True)
         thread.start()
 
-    def _on_apps_loaded(self, data):
+    def _on_apps_loaded(self, data, installed_names=None):
         """Handle apps data loaded successfully."""
+        if installed_names is not None:
+            self._installed_names = installed_names
+
         self.tested_apps = data.get('apps', [])
-        self.categories = data.get('categories', ['All'])
+        self.categories = [sys.intern(cat) for cat in data.get('categories', ['All'])]
+
+        # A handful of distinct categories, versions and dependency names are
+        # repeated across entries; share one string object per value
+        for app in self.tested_apps:
+            app['category'] = sys.intern(app.get('category', ''))
+            app['version'] = sys.intern(app.get('version', ''))
+            if app.get('dependencies'):
+                app['dependencies'] = [sys.intern(dep) for dep in app['dependencies']]
+
+        # Convert the entries to list items once; bind reads their fields
+        self._items = [_TestedAppItem(app) for app in self.tested_apps]
 
         # Update category dropdown
         self.category_model.splice(0, len(self.category_model), self.categories)
@@ -290,12 +440,20 @@ class TestedAppsView(Gtk.Box):
         logger.info(f"Loaded {len(self.tested_apps)} tested apps")
         return False
 
-    def _load_from_cache(self):
+    def _load_from_cache(self, installed_names=None):
         """Load tested apps from local cache."""
+        if installed_names is not None:
+            self._installed_names = installed_names
+
         try:
             if os.path.exists(self.cache_path):
                 logger.info(f"Loading tested apps from cache: {self.cache_path}")
-                with open(self.cache_path, 'r') as f:
+                with gzip.open(self.cache_path, 'rt', encoding='utf-8') as f:
+                    data = json.load(f)
+                    self._on_apps_loaded(data)
+            elif os.path.exists(self.legacy_cache_path):
+                logger.info(f"Loading tested apps from cache: {self.legacy_cache_path}")
+                with open(self.legacy_cache_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self._on_apps_loaded(data)
             else:
@@ -308,16 +466,31 @@ class TestedAppsView(Gtk.Box):
 
         return False
 
-    def _save_cache(self, data):
-        """Save tested apps data to local cache."""
+    def _save_cache(self, data, headers):
+        """Save tested apps data and its validators to local cache."""
         try:
             os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
-            with open(self.cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with gzip.open(self.cache_path, 'wt', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            if os.path.exists(self.legacy_cache_path):
+                os.remove(self.legacy_cache_path)
+            with open(self.cache_meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'etag': headers.get('ETag'),
+                    'last_modified': headers.get('Last-Modified'),
+                }, f)
             logger.info(f"Saved tested apps to cache: {self.cache_path}")
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
 
+    def _load_cache_meta(self):
+        """Load the ETag / Last-Modified saved with the cache."""
+        try:
+            with open(self.cache_meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
     def _on_install_clicked(self, button, app):
         """Handle install button click."""
         installation_type = app.get('installation_type', 'download')
@@ -337,6 +510,8 @@ class TestedAppsView(Gtk.Box):
         progress_dialog.set_body("Downloading installer...")
         progress_dialog.present()
 
+        progress = _ProgressUpdater(progress_dialog)
+
         def download_and_install():
             try:
                 # Download installer
@@ -345,13 +520,27 @@ class TestedAppsView(Gtk.Box):
                 dest_path = os.path.join(downloads_dir, filename)
 
                 logger.info(f"Downloading from {app['url']} to {dest_path}")
-                GLib.idle_add(lambda: progress_dialog.set_body(f"Downloading {filename}..."))
-
-                urllib.request.urlretrieve(app['url'], dest_path)
+                progress(f"Downloading {filename}...")
+
+                # Stream in 1 MiB chunks, reporting progress whenever the
+                # percentage changes
+                with self._open_download(app['url']) as response, \
+                        open(dest_path, 'wb') as f:
+                    total = int(response.headers.get('Content-Length') or 0)
+                    done = 0
+                    last_pct = -1
+                    while chunk := response.read(1 << 20):
+                        f.write(chunk)
+                        done += len(chunk)
+                        if total:
+                            pct = done * 100 // total
+                            if pct != last_pct:
+                                last_pct = pct
+                                progress(f"Downloading {filename}... {pct}%")
                 logger.info(f"Download complete: {dest_path}")
 
                 # Get or create default prefix
-                GLib.idle_add(lambda: progress_dialog.set_body("Setting up Wine prefix..."))
+                progress("Setting up Wine prefix...")
                 runner = self.runner_manager.get_default_runner()
                 if not runner:
                     GLib.idle_add(self._on_install_error, "No Wine runner available", progress_dialog)
@@ -369,7 +558,7 @@ class TestedAppsView(Gtk.Box):
                     return
 
                 # Run the installer first
-                GLib.idle_add(lambda: progress_dialog.set_body("Running installer..."))
+                progress("Running installer...")
                 logger.info(f"Running installer: {dest_path}")
 
                 import subprocess
@@ -378,14 +567,14 @@ class TestedAppsView(Gtk.Box):
                 result = subprocess.run(
                     [prefix.get('runner_path', 'wine'), dest_path],
                     env=env,
-                    capture_output=True,
-                    text=True
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
                 )
 
                 logger.info(f"Installer completed with return code: {result.returncode}")
 
                 # Now search for the installed .exe in common locations
-                GLib.idle_add(lambda: progress_dialog.set_body("Locating installed application..."))
+                progress("Locating installed application...")
                 installed_exe = self._find_installed_exe(prefix['path'], app['name'])
 
                 if not installed_exe:
@@ -395,11 +584,8 @@ class TestedAppsView(Gtk.Box):
                 logger.info(f"Using executable path: {installed_exe}")
 
                 # Add to database
-                GLib.idle_add(lambda: progress_dialog.set_body("Adding to library..."))
-                from ..core.app_launcher import AppLauncher
-                launcher = AppLauncher(self.db)
-
-                success, message, app_id = launcher.add_application(
+                progress("Adding to library...")
+                success, message, app_id = self._launcher.add_application(
                     name=app['name'],
                     executable_path=installed_exe,
                     prefix_id=prefix_id,
@@ -412,8 +598,7 @@ class TestedAppsView(Gtk.Box):
 
                 # Save dependency profile
                 if app.get('dependencies'):
-                    for dep in app['dependencies']:
-                        self.db.add_app_dependency(app_id, dep, auto_detected=False)
+                    self.db.add_app_dependencies(app_id, app['dependencies'], auto_detected=False)
 
                 # Install dependencies
                 if app.get('dependencies') and self.dep_manager.is_winetricks_available():
@@ -421,9 +606,7 @@ class TestedAppsView(Gtk.Box):
                     if prefix:
                         total = len(app['dependencies'])
                         for idx, dep in enumerate(app['dependencies'], 1):
-                            GLib.idle_add(lambda d=dep, i=idx, t=total: progress_dialog.set_body(
-                                f"Installing dependency {i} of {t}: {d}..."
-                            ))
+                            progress(f"Installing dependency {idx} of {total}: {dep}...")
                             success, msg = self.dep_manager.install_dependency(
                                 prefix['path'],
                                 dep,
@@ -441,9 +624,26 @@ class TestedAppsView(Gtk.Box):
         thread = threading.Thread(target=download_and_install, daemon=True)
         thread.start()
 
+    @contextmanager
+    def _open_download(self, url):
+        """Open a URL for streaming, reusing pooled connections if possible."""
+        if self._http is None:
+            with urllib.request.urlopen(url, timeout=30) as response:
+                yield response
+            return
+
+        response = self._http.request('GET', url, preload_content=False, timeout=30.0)
+        try:
+            if response.status >= 400:
+                raise RuntimeError(f"HTTP Error {response.status}: {response.reason}")
+            yield response
+        finally:
+            response.release_conn()
+
     def _on_install_complete(self, app_name, progress_dialog):
         """Handle successful installation."""
         progress_dialog.close()
+        self._invalidate_installed_names()
 
         dialog = Adw.MessageDialog.new(self.get_root())
         dialog.set_heading("Installation Complete")
@@ -475,10 +675,12 @@ class TestedAppsView(Gtk.Box):
         progress_dialog.set_body("Creating Wine prefix and container...")
         progress_dialog.present()
 
+        progress = _ProgressUpdater(progress_dialog)
+
         def setup_thread():
             try:
                 # Get or create default prefix
-                GLib.idle_add(lambda: progress_dialog.set_body("Setting up Wine prefix..."))
+                progress("Setting up Wine prefix...")
                 runner = self.runner_manager.get_default_runner()
                 if not runner:
                     GLib.idle_add(self._on_install_error, "No Wine runner available", progress_dialog)
@@ -509,9 +711,7 @@ class TestedAppsView(Gtk.Box):
                 if app.get('dependencies') and self.dep_manager.is_winetricks_available():
                     total = len(app['dependencies'])
                     for idx, dep in enumerate(app['dependencies'], 1):
-                        GLib.idle_add(lambda d=dep, i=idx, t=total: progress_dialog.set_body(
-                            f"Installing dependency {i} of {t}: {d}..."
-                        ))
+                        progress(f"Installing dependency {idx} of {total}: {dep}...")
                         success, msg = self.dep_manager.install_dependency(
                             prefix['path'],
                             dep,
@@ -527,16 +727,13 @@ class TestedAppsView(Gtk.Box):
                     f.write(f"{instructions}\n\n")
                     f.write(f"After placing files here, add the .exe to WineTranslator using the + button.\n")
 
-                # Add placeholder to database
-                from ..core.app_launcher import AppLauncher
-                launcher = AppLauncher(self.db)
-
-                # Use container path as executable for now
+                # Add placeholder to database, using the container path as
+                # executable for now
                 placeholder_exe = os.path.join(container_path, 'PLACE_FILES_HERE.txt')
                 with open(placeholder_exe, 'w') as f:
                     f.write("Place your application files in this folder")
 
-                success, message, app_id = launcher.add_application(
+                success, message, app_id = self._launcher.add_application(
                     name=f"{app['name']} (Container)",
                     executable_path=container_path,  # Store container path
                     prefix_id=prefix_id,
@@ -556,6 +753,7 @@ class TestedAppsView(Gtk.Box):
     def _open_container_folder(self, app_name, container_path, progress_dialog):
         """Open the container folder and show instructions."""
         progress_dialog.close()
+        self._invalidate_installed_names()
 
         # Open folder in file manager
         try:
@@ -8,17 +8,10 @@ import sys
 import os
 import logging
 
-from .database.db import Database
-from .core.app_launcher import AppLauncher
-from .utils.logger import setup_logging
-
 
 def launch():
     """Launch an application by ID from command line."""
-    # Set up logging
-    setup_logging()
-    logger = logging.getLogger(__name__)
-
+    # Validate arguments first so bad invocations exit without any setup
     if len(sys.argv) < 2:
         print("Usage: winetranslator-launch <app_id>")
         sys.exit(1)
@@ -29,7 +22,19 @@ def launch():
         print(f"Error: Invalid app ID '{sys.argv[1]}'. Must be a number.")
         sys.exit(1)
 
+    # Full log-file setup only when debugging; a shortcut click just needs
+    # warnings on stderr
+    if os.environ.get('WINETRANSLATOR_DEBUG') == '1':
+        from .utils.logger import setup_logging
+        setup_logging()
+    else:
+        logging.basicConfig(level=logging.WARNING)
+    logger = logging.getLogger(__name__)
+
     try:
+        from .database.db import Database
+        from .core.app_launcher import AppLauncher
+
         # Initialize database
         db = Database()
 
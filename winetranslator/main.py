@@ -6,6 +6,7 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 from gi.repository import Gtk, Adw, Gio, GLib
+import queue
 import sys
 import threading
 import logging
@@ -13,13 +14,11 @@ import os
 from pathlib import Path
 
 from .database.db import Database
-from .gui.main_window import MainWindow
-from .core.updater import Updater
-from .utils.first_run import FirstRunChecker
-from .utils.logger import setup_logging
+from .utils.logger import setup_logging, flush_logging
 
-# Set up logging
-logger = setup_logging()
+# Configured by setup_logging() in do_startup; the window, updater and
+# dependency checker are imported where they are first used
+logger = logging.getLogger('winetranslator')
 
 
 class WineTranslatorApp(Adw.Application):
@@ -31,35 +30,50 @@ class WineTranslatorApp(Adw.Application):
             application_id='com.winetranslator.WineTranslator',
             flags=Gio.ApplicationFlags.FLAGS_NONE
         )
-        self.db = None
+        self._db = None
+
+        # Callbacks posted from worker threads (see _post_to_ui)
+        self._ui_queue = queue.Queue()
+        self._ui_lock = threading.Lock()
+        self._ui_idle_pending = False
+
+        # Shared updater, and whether a check or update is running
+        self._updater = None
+        self._update_in_flight = False
+
+    @property
+    def db(self) -> Database:
+        """The application database, opened on first use."""
+        if self._db is None:
+            logger.info("Initializing database")
+            self._db = Database()
+        return self._db
 
     def do_activate(self):
         """Activate the application."""
         logger.info("Application activated")
 
+        from .gui.main_window import MainWindow
+        from .utils.first_run import FirstRunChecker
+
         # Check dependencies on first run
         checker = FirstRunChecker()
         all_ok, missing = checker.check_all()
 
         if not all_ok:
-            logger.warning(f"Missing dependencies: {missing}")
+            logger.warning("Missing dependencies: %s", missing)
             # Show dependency warning dialog
             self._show_dependency_warning(checker)
             return
 
         logger.info("All dependencies present")
 
-        # Initialize database
-        if not self.db:
-            logger.info("Initializing database")
-            self.db = Database()
-
         # Create main window
         logger.info("Creating main window")
         window = MainWindow(self, self.db)
         window.present()
 
-    def _show_dependency_warning(self, checker: FirstRunChecker):
+    def _show_dependency_warning(self, checker):
         """Show warning dialog for missing dependencies."""
         # Create a minimal window to show the dialog
         window = Adw.Window()
@@ -80,9 +94,9 @@ class WineTranslatorApp(Adw.Application):
     def _on_dependency_warning_response(self, dialog, response):
         """Handle dependency warning response."""
         if response == "continue":
+            from .gui.main_window import MainWindow
+
             # User wants to continue anyway
-            if not self.db:
-                self.db = Database()
             window = MainWindow(self, self.db)
             window.present()
         else:
@@ -92,6 +106,7 @@ class WineTranslatorApp(Adw.Application):
     def do_startup(self):
         """Application startup."""
         Adw.Application.do_startup(self)
+        setup_logging()
 
         # Force dark theme
         style_manager = Adw.StyleManager.get_default()
@@ -119,6 +134,34 @@ class WineTranslatorApp(Adw.Application):
         self.add_action(quit_action)
         self.set_accels_for_action("app.quit", ["<Control>q"])
 
+    def _post_to_ui(self, callback, *args):
+        """Run a callback once on the main loop, from any thread."""
+        self._ui_queue.put((callback, args))
+
+        # Keep at most one idle source outstanding; it drains the whole queue.
+        # These callbacks swap dialogs the user is waiting on, so they run at
+        # default priority instead of queueing behind redraws.
+        with self._ui_lock:
+            if self._ui_idle_pending:
+                return
+            self._ui_idle_pending = True
+        GLib.idle_add(self._drain_ui_queue, priority=GLib.PRIORITY_DEFAULT)
+
+    def _drain_ui_queue(self):
+        """Run the callbacks posted from worker threads."""
+        # Clear the flag first so a post racing with the drain schedules a
+        # new idle instead of being left in the queue
+        with self._ui_lock:
+            self._ui_idle_pending = False
+
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            callback(*args)
+        return GLib.SOURCE_REMOVE
+
     def on_about(self, action, param):
         """Show about dialog."""
         about = Adw.AboutWindow(
@@ -136,7 +179,15 @@ class WineTranslatorApp(Adw.Application):
 
     def on_update(self, action, param):
         """Show update dialog."""
-        updater = Updater()
+        from .core.updater import Updater
+
+        # Ignore repeated clicks while a check or update is still running
+        if self._update_in_flight:
+            return
+
+        if self._updater is None:
+            self._updater = Updater()
+        updater = self._updater
 
         if not updater.is_git_repo():
             dialog = Adw.MessageDialog.new(self.get_active_window())
@@ -153,15 +204,18 @@ class WineTranslatorApp(Adw.Application):
         check_dialog.present()
 
         # Check for updates in background
+        self._update_in_flight = True
+
         def check_thread():
             has_updates, message, remote_commit = updater.check_for_updates()
-            GLib.idle_add(self._on_update_check_complete, has_updates, message, check_dialog, updater)
+            self._post_to_ui(self._on_update_check_complete, has_updates, message, check_dialog, updater)
 
         thread = threading.Thread(target=check_thread, daemon=True)
         thread.start()
 
     def _on_update_check_complete(self, has_updates, message, check_dialog, updater):
         """Handle update check completion."""
+        self._update_in_flight = False
         check_dialog.close()
 
         if has_updates:
@@ -192,15 +246,18 @@ class WineTranslatorApp(Adw.Application):
             progress_dialog.present()
 
             # Update in background
+            self._update_in_flight = True
+
             def update_thread():
                 success, message = updater.update()
-                GLib.idle_add(self._on_update_complete, success, message, progress_dialog)
+                self._post_to_ui(self._on_update_complete, success, message, progress_dialog)
 
             thread = threading.Thread(target=update_thread, daemon=True)
             thread.start()
 
     def _on_update_complete(self, success, message, progress_dialog):
         """Handle update completion."""
+        self._update_in_flight = False
         progress_dialog.close()
 
         dialog = Adw.MessageDialog.new(self.get_active_window())
@@ -221,10 +278,12 @@ class WineTranslatorApp(Adw.Application):
     def _on_restart_response(self, dialog, response):
         """Handle restart response."""
         if response == "restart":
-            # Restart the application
-            import os
-            import sys
-            os.execv(sys.executable, ['python3', '-m', 'winetranslator'])
+            # Restart the application with the interpreter and arguments it
+            # was started with (sys.orig_argv keeps a "-m winetranslator")
+            if self._db is not None:
+                self._db.close()
+            flush_logging()
+            os.execv(sys.executable, [sys.executable, *sys.orig_argv[1:]])
 
     def on_preferences(self, action, param):
         """Show preferences dialog."""
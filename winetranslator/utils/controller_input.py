@@ -4,13 +4,29 @@ Controller input detection for button remapping.
 Detects button presses and joystick axes from /dev/input/js* devices.
 """
 
+import array
 import struct
+import select
 import time
 import os
-import glob
 from typing import Optional, Tuple, Callable
 from pathlib import Path
 
+# struct js_event {
+#     __u32 time;     /* event timestamp in milliseconds */
+#     __s16 value;    /* value */
+#     __u8 type;      /* event type */
+#     __u8 number;    /* axis/button number */
+# };
+_JS_EVENT = struct.Struct('=IhBB')
+
+# Events read per os.read() call in wait_for_input
+_JS_EVENT_BATCH = 32
+
+# (device_path, inode) -> (device_name, guid); the remap dialog opens a new
+# ControllerInput per button, so sysfs is only read once per device node
+_DEVICE_INFO_CACHE = {}
+
 
 class ControllerInput:
     """Handles controller input detection for button remapping."""
@@ -20,6 +36,18 @@ class ControllerInput:
     JS_EVENT_AXIS = 0x02
     JS_EVENT_INIT = 0x80
 
+    # Standard Xbox controller layout (most common default)
+    _MAPPING_TEMPLATE = (
+        "{guid},{name},"
+        "a:b0,b:b1,x:b2,y:b3,"  # Face buttons
+        "back:b6,start:b7,guide:b8,"  # Special buttons
+        "leftshoulder:b4,rightshoulder:b5,"  # Bumpers
+        "leftstick:b9,rightstick:b10,"  # Stick clicks
+        "leftx:a0,lefty:a1,rightx:a2,righty:a3,"  # Stick axes
+        "lefttrigger:a4,righttrigger:a5,"  # Triggers
+        "dpup:h0.1,dpdown:h0.4,dpleft:h0.8,dpright:h0.2"  # D-pad
+    )
+
     def __init__(self, device_path: Optional[str] = None):
         """
         Initialize controller input detector.
@@ -36,12 +64,28 @@ class ControllerInput:
 
         self.device_path = device_path
         self.device_fd = None
-        self.device_name = self._get_device_name()
-        self.guid = self._get_device_guid()
+
+        try:
+            key = (device_path, os.stat(device_path).st_ino)
+        except OSError:
+            key = None
+
+        cached = _DEVICE_INFO_CACHE.get(key)
+        if cached is not None:
+            self.device_name, self.guid = cached
+        else:
+            self.device_name = self._get_device_name()
+            self.guid = self._get_device_guid()
+            if key is not None:
+                _DEVICE_INFO_CACHE[key] = (self.device_name, self.guid)
 
     def _find_controller(self) -> Optional[str]:
         """Find the first available joystick device."""
-        devices = glob.glob('/dev/input/js*')
+        try:
+            with os.scandir('/dev/input') as entries:
+                devices = [entry.path for entry in entries if entry.name.startswith('js')]
+        except FileNotFoundError:
+            return None
         if devices:
             return sorted(devices)[0]  # Return js0, js1, etc. in order
         return None
@@ -72,19 +116,25 @@ class ControllerInput:
         try:
             device_num = self.device_path.split('js')[-1]
 
-            # Try to get vendor/product IDs
-            event_devices = glob.glob(f'/sys/class/input/js{device_num}/device/event*/device/id/*')
-
+            # Try to get vendor/product IDs from the first event node
             vendor = "0000"
             product = "0000"
 
-            for path in event_devices:
-                if 'vendor' in path:
-                    with open(path, 'r') as f:
-                        vendor = f.read().strip().replace('0x', '')
-                elif 'product' in path:
-                    with open(path, 'r') as f:
-                        product = f.read().strip().replace('0x', '')
+            try:
+                with os.scandir(f'/sys/class/input/js{device_num}/device') as it:
+                    entries = [entry for entry in it if entry.name.startswith('event')]
+            except FileNotFoundError:
+                entries = []
+
+            for entry in entries:
+                id_dir = os.path.join(entry.path, 'device', 'id')
+                if not os.path.isdir(id_dir):
+                    continue
+                with open(os.path.join(id_dir, 'vendor'), 'r') as f:
+                    vendor = f.read().strip().replace('0x', '')
+                with open(os.path.join(id_dir, 'product'), 'r') as f:
+                    product = f.read().strip().replace('0x', '')
+                break
 
             # Generate SDL2-compatible GUID
             # Format: 03000000VVVV0000PPPP000000000000
@@ -102,12 +152,16 @@ class ControllerInput:
     def open(self):
         """Open the joystick device for reading."""
         if self.device_fd is None:
-            self.device_fd = open(self.device_path, 'rb')
+            # Unbuffered, non-blocking raw fd; wait_for_input sleeps in
+            # select() instead. Close it across exec so launched games
+            # don't inherit the device.
+            self.device_fd = os.open(self.device_path,
+                                     os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
 
     def close(self):
         """Close the joystick device."""
-        if self.device_fd:
-            self.device_fd.close()
+        if self.device_fd is not None:
+            os.close(self.device_fd)
             self.device_fd = None
 
     def wait_for_input(self, timeout: float = 30.0) -> Optional[Tuple[str, int]]:
@@ -130,62 +184,72 @@ class ControllerInput:
 
         start_time = time.time()
 
-        # Track initial axis values to detect movement
-        initial_axes = {}
+        # Track initial axis values to detect movement, indexed by the
+        # event's u8 axis number; seen marks which slots are set
+        initial_axes = array.array('h', bytes(2 * 256))
+        seen = bytearray(256)
         axis_threshold = 16000  # Threshold for axis movement (out of 32767)
+        axis_threshold_sq = axis_threshold * axis_threshold
 
-        while time.time() - start_time < timeout:
-            # Read joystick event (8 bytes)
+        while True:
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                break
+
+            # Read a batch of joystick events (8 bytes each)
             try:
-                event = self.device_fd.read(8)
-                if len(event) < 8:
+                # Sleep in the kernel until an event arrives or time runs out
+                ready, _, _ = select.select([self.device_fd], [], [], remaining)
+                if not ready:
                     break
 
-                # Parse event structure
-                # struct js_event {
-                #     __u32 time;     /* event timestamp in milliseconds */
-                #     __s16 value;    /* value */
-                #     __u8 type;      /* event type */
-                #     __u8 number;    /* axis/button number */
-                # };
-                timestamp, value, event_type, number = struct.unpack('IhBB', event)
-
-                # Ignore init events
-                if event_type & self.JS_EVENT_INIT:
-                    if event_type & self.JS_EVENT_AXIS:
-                        # Store initial axis position
-                        initial_axes[number] = value
+                try:
+                    buf = os.read(self.device_fd, _JS_EVENT.size * _JS_EVENT_BATCH)
+                except BlockingIOError:
                     continue
+                if len(buf) < _JS_EVENT.size:
+                    break
 
-                # Button press (value = 1 means pressed, 0 means released)
-                if event_type == self.JS_EVENT_BUTTON and value == 1:
-                    return ('button', number)
-
-                # Axis movement (detect significant movement from initial position)
-                if event_type == self.JS_EVENT_AXIS:
-                    if number in initial_axes:
-                        initial_value = initial_axes[number]
-                    else:
-                        initial_value = 0
-                        initial_axes[number] = value
-
-                    # Check if axis moved significantly
-                    if abs(value - initial_value) > axis_threshold:
-                        # Determine axis direction
-                        axis_str = f"a{number}"
-                        if value < initial_value:
-                            axis_str += "-"  # Negative direction
+                # The driver only hands out whole events, but trim to be safe
+                buf = buf[:len(buf) - len(buf) % _JS_EVENT.size]
+
+                for timestamp, value, event_type, number in _JS_EVENT.iter_unpack(buf):
+                    # Ignore init events
+                    if event_type & self.JS_EVENT_INIT:
+                        if event_type & self.JS_EVENT_AXIS:
+                            # Store initial axis position
+                            initial_axes[number] = value
+                            seen[number] = 1
+                        continue
+
+                    # Button press (value = 1 means pressed, 0 means released)
+                    if event_type == self.JS_EVENT_BUTTON and value == 1:
+                        return ('button', number)
+
+                    # Axis movement (detect significant movement from initial position)
+                    if event_type == self.JS_EVENT_AXIS:
+                        if seen[number]:
+                            initial_value = initial_axes[number]
                         else:
-                            axis_str += "+"  # Positive direction
-                        return ('axis', axis_str)
+                            initial_value = 0
+                            initial_axes[number] = value
+                            seen[number] = 1
+
+                        # Check if axis moved significantly
+                        delta = value - initial_value
+                        if delta * delta > axis_threshold_sq:
+                            # Determine axis direction
+                            axis_str = f"a{number}"
+                            if value < initial_value:
+                                axis_str += "-"  # Negative direction
+                            else:
+                                axis_str += "+"  # Positive direction
+                            return ('axis', axis_str)
 
             except Exception as e:
                 print(f"Error reading controller input: {e}")
                 break
 
-            # Small delay to prevent CPU spinning
-            time.sleep(0.01)
-
         return None
 
     def get_default_mapping(self) -> str:
@@ -195,18 +259,7 @@ class ControllerInput:
         Returns:
             SDL mapping string in format: "GUID,name,a:b0,b:b1,..."
         """
-        # Standard Xbox controller layout (most common default)
-        mapping = (
-            f"{self.guid},{self.device_name},"
-            "a:b0,b:b1,x:b2,y:b3,"  # Face buttons
-            "back:b6,start:b7,guide:b8,"  # Special buttons
-            "leftshoulder:b4,rightshoulder:b5,"  # Bumpers
-            "leftstick:b9,rightstick:b10,"  # Stick clicks
-            "leftx:a0,lefty:a1,rightx:a2,righty:a3,"  # Stick axes
-            "lefttrigger:a4,righttrigger:a5,"  # Triggers
-            "dpup:h0.1,dpdown:h0.4,dpleft:h0.8,dpright:h0.2"  # D-pad
-        )
-        return mapping
+        return self._MAPPING_TEMPLATE.format(guid=self.guid, name=self.device_name)
 
     def __enter__(self):
         """Context manager entry."""
@@ -4,43 +4,96 @@ First-run setup helper for WineTranslator.
 Checks for required system dependencies and helps the user install them.
 """
 
+import os
 import subprocess
-import shutil
+from functools import cache, lru_cache
+from pathlib import Path
 from typing import Tuple, List
 
+# Install command for the dependencies, by /etc/os-release ID
+INSTALL_INSTRUCTIONS = {
+    'debian': 'sudo apt install wine winetricks python3-gi gir1.2-gtk-4.0 gir1.2-adw-1',
+    'ubuntu': 'sudo apt install wine winetricks python3-gi gir1.2-gtk-4.0 gir1.2-adw-1',
+    'fedora': 'sudo dnf install wine winetricks python3-gobject gtk4 libadwaita',
+    'arch': 'sudo pacman -S wine winetricks python-gobject gtk4 libadwaita',
+    'opensuse': 'sudo zypper install wine winetricks python3-gobject gtk4 libadwaita-1-0',
+}
+GENERIC_INSTRUCTIONS = "Please install: Wine, Winetricks, GTK4, Libadwaita, and PyGObject"
+
+
+def _find_executables(names) -> set:
+    """Return which of names are executables on PATH, in one pass over PATH."""
+    wanted = set(names)
+    found = set()
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        for name in wanted - found:
+            path = os.path.join(directory or os.curdir, name)
+            if os.access(path, os.X_OK) and not os.path.isdir(path):
+                found.add(name)
+        if found == wanted:
+            break
+    return found
+
+
+def _typelib_available(namespace: str, version: str) -> bool:
+    """Check whether a GObject introspection typelib version is installed."""
+    try:
+        import gi
+    except ImportError:
+        return False
+    return version in gi.Repository.get_default().enumerate_versions(namespace)
+
+
+@lru_cache(maxsize=8)
+def _format_missing_message(missing: Tuple[str, ...], distro: str) -> str:
+    """Render the missing-dependencies message for a set of results."""
+    cmd = INSTALL_INSTRUCTIONS.get(distro.lower(), GENERIC_INSTRUCTIONS)
+
+    message = "WineTranslator requires the following dependencies:\n\n"
+    message += "\n".join(f"  • {dep}" for dep in missing)
+    message += "\n\nTo install them, run:\n\n"
+    message += f"  {cmd}\n"
+
+    return message
+
+
+@cache
+def _read_distro_id() -> str:
+    """Read the distribution ID from /etc/os-release (once per process)."""
+    try:
+        for line in Path('/etc/os-release').read_text().splitlines():
+            if line.startswith('ID='):
+                return line.split('=')[1].strip().strip('"')
+    except OSError:
+        pass
+    return 'unknown'
+
 
 class FirstRunChecker:
     """Checks system dependencies on first run."""
 
+    # (PATH, result) of the last passing check_all, shared by all instances
+    _passed = None
+
     def __init__(self):
         """Initialize the first run checker."""
         self.missing_deps = []
 
     def check_wine(self) -> bool:
         """Check if Wine is installed."""
-        return shutil.which('wine') is not None
+        return 'wine' in _find_executables(('wine',))
 
     def check_winetricks(self) -> bool:
         """Check if Winetricks is installed."""
-        return shutil.which('winetricks') is not None
+        return 'winetricks' in _find_executables(('winetricks',))
 
     def check_gtk4(self) -> bool:
         """Check if GTK4 Python bindings are available."""
-        try:
-            import gi
-            gi.require_version('Gtk', '4.0')
-            return True
-        except (ImportError, ValueError):
-            return False
+        return _typelib_available('Gtk', '4.0')
 
     def check_libadwaita(self) -> bool:
         """Check if Libadwaita Python bindings are available."""
-        try:
-            import gi
-            gi.require_version('Adw', '1')
-            return True
-        except (ImportError, ValueError):
-            return False
+        return _typelib_available('Adw', '1')
 
     def check_all(self) -> Tuple[bool, List[str]]:
         """
@@ -49,12 +102,22 @@ class FirstRunChecker:
         Returns:
             Tuple of (all_ok, missing_dependencies_list)
         """
+        # A passing result holds for the rest of the process unless PATH
+        # changes; failures are always re-probed so a fresh install is seen
+        path = os.environ.get('PATH')
+        passed = FirstRunChecker._passed
+        if passed is not None and passed[0] == path:
+            return passed[1]
+
         missing = []
 
-        if not self.check_wine():
+        # Look for both programs in a single walk over PATH
+        executables = _find_executables(('wine', 'winetricks'))
+
+        if 'wine' not in executables:
             missing.append("Wine")
 
-        if not self.check_winetricks():
+        if 'winetricks' not in executables:
             missing.append("Winetricks (optional)")
 
         if not self.check_gtk4():
@@ -63,7 +126,10 @@ class FirstRunChecker:
         if not self.check_libadwaita():
             missing.append("Libadwaita")
 
-        return len([m for m in missing if "optional" not in m]) == 0, missing
+        all_ok = len([m for m in missing if "optional" not in m]) == 0
+        if all_ok:
+            FirstRunChecker._passed = (path, (all_ok, list(missing)))
+        return all_ok, missing
 
     def get_install_instructions(self, distro: str = None) -> str:
         """
@@ -78,27 +144,11 @@ class FirstRunChecker:
         if distro is None:
             distro = self._detect_distro()
 
-        instructions = {
-            'debian': 'sudo apt install wine winetricks python3-gi gir1.2-gtk-4.0 gir1.2-adw-1',
-            'ubuntu': 'sudo apt install wine winetricks python3-gi gir1.2-gtk-4.0 gir1.2-adw-1',
-            'fedora': 'sudo dnf install wine winetricks python3-gobject gtk4 libadwaita',
-            'arch': 'sudo pacman -S wine winetricks python-gobject gtk4 libadwaita',
-            'opensuse': 'sudo zypper install wine winetricks python3-gobject gtk4 libadwaita-1-0',
-        }
-
-        return instructions.get(distro.lower(),
-                               "Please install: Wine, Winetricks, GTK4, Libadwaita, and PyGObject")
+        return INSTALL_INSTRUCTIONS.get(distro.lower(), GENERIC_INSTRUCTIONS)
 
     def _detect_distro(self) -> str:
         """Detect the Linux distribution."""
-        try:
-            with open('/etc/os-release', 'r') as f:
-                for line in f:
-                    if line.startswith('ID='):
-                        return line.split('=')[1].strip().strip('"')
-        except:
-            pass
-        return 'unknown'
+        return _read_distro_id()
 
     def get_friendly_message(self) -> str:
         """
@@ -112,12 +162,4 @@ class FirstRunChecker:
         if all_ok:
             return "All required dependencies are installed!"
 
-        distro = self._detect_distro()
-        cmd = self.get_install_instructions(distro)
-
-        message = "WineTranslator requires the following dependencies:\n\n"
-        message += "\n".join(f"  • {dep}" for dep in missing)
-        message += "\n\nTo install them, run:\n\n"
-        message += f"  {cmd}\n"
-
-        return message
+        return _format_missing_message(tuple(missing), self._detect_distro())
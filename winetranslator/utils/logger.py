@@ -2,10 +2,16 @@
 Logging configuration for WineTranslator.
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 
+# Background thread writing queued records to the handlers (see setup_logging)
+_listener = None
+
 
 def setup_logging():
     """
@@ -14,7 +20,11 @@ def setup_logging():
     Logs go to:
     - ~/.local/share/winetranslator/winetranslator.log
     - Console (stdout)
+
+    Records are queued by the calling thread and written by a background
+    listener, so logging from GTK callbacks never waits on file I/O.
     """
+    global _listener
     # Create log directory
     data_home = os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share'))
     log_dir = os.path.join(data_home, 'winetranslator')
@@ -22,17 +32,34 @@ def setup_logging():
 
     log_file = os.path.join(log_dir, 'winetranslator.log')
 
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    # Configure root logger (only once, like logging.basicConfig)
+    root = logging.getLogger()
+    if _listener is None and not root.handlers:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(-1)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        # WT_LOG_LEVEL=DEBUG restores the verbose output
+        level_name = os.environ.get('WT_LOG_LEVEL', 'INFO').upper()
+        root.setLevel(getattr(logging, level_name, logging.INFO))
+        logging.getLogger('urllib3').setLevel(logging.WARNING)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _listener.start()
+        atexit.register(_listener.stop)
 
     logger = logging.getLogger('winetranslator')
     logger.info(f"Logging initialized. Log file: {log_file}")
 
     return logger
+
+
+def flush_logging():
+    """Write out any queued log records, e.g. before the process is replaced."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -3,45 +3,126 @@ Wine utility functions for detection and version management.
 """
 
 import os
+import select
+import shutil
+import stat
 import subprocess
+import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cache, partial
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+# Home directory, resolved once at import
+_HOME = os.path.expanduser('~')
+
+# Common Wine installation directories, scanned besides PATH
+COMMON_WINE_DIRS = [
+    '/usr/bin',
+    '/usr/local/bin',
+    f'{_HOME}/.local/bin',
+    f'{_HOME}/.local/share/lutris/runners/wine',
+]
+
+# Steam library directories holding Proton installations
+STEAM_DIRS = [
+    f'{_HOME}/.steam/steam/steamapps/common',
+    f'{_HOME}/.local/share/Steam/steamapps/common',
+]
+
+# Per-application Wine output logs (see launch_wine_application)
+APP_LOG_DIR = os.path.join(os.environ.get('XDG_DATA_HOME', f'{_HOME}/.local/share'),
+                           'winetranslator', 'app_logs')
+
+# App name -> log file path (see _app_log_path)
+_LOG_PATH_CACHE = {}
+
+# Detection results, keyed by the state of the directories they came from
+# (see _dirs_cache_key); cleared by invalidate_wine_cache()
+_WINE_EXEC_CACHE = {}
+_DEPENDENCY_CACHE = {}
+
+# (wine_path, st_mtime_ns, st_size) -> version string
+_WINE_VERSION_CACHE = {}
+
+# Version in `wine --version` output like "wine-9.0" or "wine-8.0.1 (Staging)"
+_WINE_VERSION_RE = re.compile(r'wine[- ](\d+\.\d+(?:\.\d+)?)')
+
+# Filesystems where a plain stat may force a round-trip to the server
+_NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'fuse.sshfs'}
+
+# statx() constants (linux/stat.h, linux/fcntl.h)
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_SIZE = 0x200
+
+
+def _dirs_cache_key(directories) -> tuple:
+    """Build a cache key from the modification times of directories."""
+    key = []
+    for directory in directories:
+        try:
+            key.append((directory, os.stat(directory).st_mtime_ns))
+        except OSError:
+            key.append((directory, None))
+    return tuple(key)
+
+
+def _path_dirs() -> List[str]:
+    """Get the directories on PATH."""
+    return os.environ.get('PATH', os.defpath).split(os.pathsep)
+
+
+def invalidate_wine_cache():
+    """Forget cached Wine detection results, e.g. after installing Wine."""
+    _WINE_EXEC_CACHE.clear()
+    _DEPENDENCY_CACHE.clear()
+    _WINE_VERSION_CACHE.clear()
+
 
 def find_wine_executables() -> List[Dict[str, str]]:
     """
     Find all available Wine executables on the system.
 
+    Results are cached until PATH or one of the scanned directories changes.
+
     Returns:
         List of dicts with 'name', 'path', 'version', and 'type' keys.
     """
+    key = _dirs_cache_key(_path_dirs() + COMMON_WINE_DIRS + STEAM_DIRS)
+    cached = _WINE_EXEC_CACHE.get(key)
+    if cached is None:
+        cached = _WINE_EXEC_CACHE[key] = _scan_wine_executables()
+    return [dict(wine) for wine in cached]
+
+
+def _scan_wine_executables() -> List[Dict[str, str]]:
+    """Scan PATH, common directories and Steam for Wine executables."""
     wine_executables = []
 
     # Common Wine executable names
     wine_names = ['wine', 'wine64', 'wine-staging', 'wine-devel']
 
+    # Collect candidates first; versions are probed together at the end
+    # Paths already listed, so each executable is only added once
+    seen_paths = set()
+
     # Check PATH
     for wine_name in wine_names:
         wine_path = _which(wine_name)
         if wine_path:
-            version = get_wine_version(wine_path)
+            seen_paths.add(wine_path)
             wine_executables.append({
                 'name': wine_name,
                 'path': wine_path,
-                'version': version,
+                'version': None,
                 'type': 'wine'
             })
 
     # Check common Wine installation directories
-    common_dirs = [
-        '/usr/bin',
-        '/usr/local/bin',
-        os.path.expanduser('~/.local/bin'),
-        os.path.expanduser('~/.local/share/lutris/runners/wine'),
-    ]
-
-    for directory in common_dirs:
+    for directory in COMMON_WINE_DIRS:
         if os.path.isdir(directory):
             # For Lutris-style directories, check subdirectories
             if 'lutris' in directory:
@@ -51,12 +132,12 @@ def find_wine_executables() -> List[Dict[str, str]]:
                     wine_path = os.path.join(directory, wine_name)
                     if os.path.isfile(wine_path) and os.access(wine_path, os.X_OK):
                         # Avoid duplicates
-                        if not any(w['path'] == wine_path for w in wine_executables):
-                            version = get_wine_version(wine_path)
+                        if wine_path not in seen_paths:
+                            seen_paths.add(wine_path)
                             wine_executables.append({
                                 'name': wine_name,
                                 'path': wine_path,
-                                'version': version,
+                                'version': None,
                                 'type': 'wine'
                             })
 
@@ -64,70 +145,78 @@ def find_wine_executables() -> List[Dict[str, str]]:
     proton_executables = _find_proton_installations()
     wine_executables.extend(proton_executables)
 
+    # Each probe mostly waits on process startup, so run them concurrently
+    if wine_executables:
+        paths = [wine['path'] for wine in wine_executables]
+        with ThreadPoolExecutor(max_workers=min(16, len(paths))) as executor:
+            versions = list(executor.map(get_wine_version, paths))
+        for wine, version in zip(wine_executables, versions):
+            wine['version'] = version
+
     return wine_executables
 
 
 def _which(program: str) -> Optional[str]:
     """Find program in PATH (similar to 'which' command)."""
-    try:
-        result = subprocess.run(['which', program], capture_output=True, text=True)
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except Exception:
-        pass
-    return None
+    return shutil.which(program)
 
 
 def _scan_lutris_runners(base_dir: str) -> List[Dict[str, str]]:
     """Scan Lutris runners directory for Wine versions."""
     runners = []
     try:
-        for item in os.listdir(base_dir):
-            item_path = os.path.join(base_dir, item)
-            if os.path.isdir(item_path):
-                # Look for wine binary in bin subdirectory
-                wine_bin = os.path.join(item_path, 'bin', 'wine')
-                if os.path.isfile(wine_bin) and os.access(wine_bin, os.X_OK):
-                    version = get_wine_version(wine_bin)
-                    runners.append({
-                        'name': f'Lutris - {item}',
-                        'path': wine_bin,
-                        'version': version,
-                        'type': 'wine'
-                    })
+        with os.scandir(base_dir) as entries:
+            items = [entry for entry in entries if entry.is_dir()]
     except OSError:
-        pass
+        return runners
+
+    for entry in items:
+        # Look for wine binary in bin subdirectory
+        wine_bin = os.path.join(entry.path, 'bin', 'wine')
+        if _is_executable_file(wine_bin):
+            runners.append({
+                'name': f'Lutris - {entry.name}',
+                'path': wine_bin,
+                'version': None,  # Filled in by _scan_wine_executables
+                'type': 'wine'
+            })
     return runners
 
 
+def _is_executable_file(path: str) -> bool:
+    """Check for an executable regular file with a single stat."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o111)
+
+
 def _find_proton_installations() -> List[Dict[str, str]]:
     """Find Proton installations from Steam."""
     proton_installations = []
-    steam_dirs = [
-        os.path.expanduser('~/.steam/steam/steamapps/common'),
-        os.path.expanduser('~/.local/share/Steam/steamapps/common'),
-    ]
-
-    for steam_dir in steam_dirs:
-        if not os.path.isdir(steam_dir):
-            continue
 
+    for steam_dir in STEAM_DIRS:
+        # A missing directory fails the scandir itself; no separate isdir.
+        # The name and type tests use the directory listing alone, so the
+        # many game directories next to Proton cost no extra syscalls.
         try:
-            for item in os.listdir(steam_dir):
-                if item.startswith('Proton'):
-                    proton_path = os.path.join(steam_dir, item)
-                    wine_bin = os.path.join(proton_path, 'files', 'bin', 'wine')
-                    if os.path.isfile(wine_bin) and os.access(wine_bin, os.X_OK):
-                        version = get_wine_version(wine_bin)
-                        proton_installations.append({
-                            'name': item,
-                            'path': wine_bin,
-                            'version': version,
-                            'type': 'proton'
-                        })
+            with os.scandir(steam_dir) as entries:
+                items = [entry for entry in entries
+                         if entry.name.startswith('Proton') and entry.is_dir()]
         except OSError:
             continue
 
+        for entry in items:
+            wine_bin = os.path.join(entry.path, 'files', 'bin', 'wine')
+            if _is_executable_file(wine_bin):
+                proton_installations.append({
+                    'name': entry.name,
+                    'path': wine_bin,
+                    'version': None,  # Filled in by _scan_wine_executables
+                    'type': 'proton'
+                })
+
     return proton_installations
 
 
@@ -141,21 +230,55 @@ def get_wine_version(wine_path: str) -> str:
     Returns:
         Version string or 'Unknown' if detection fails.
     """
+    # Reuse the answer while the binary is unchanged
     try:
-        result = subprocess.run(
+        st = os.stat(wine_path)
+        key = (wine_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+
+    version = _WINE_VERSION_CACHE.get(key)
+    if version is None:
+        version = _probe_wine_version(wine_path)
+        if key is not None:
+            _WINE_VERSION_CACHE[key] = version
+    return version
+
+
+def _probe_wine_version(wine_path: str) -> str:
+    """
+    Run a Wine executable with --version and parse the result.
+
+    Only the first output line is needed, so the child is killed as soon
+    as it has been read instead of waiting for it to exit (a Wine build
+    that hangs after printing no longer costs the full timeout).
+    """
+    try:
+        process = subprocess.Popen(
             [wine_path, '--version'],
-            capture_output=True,
-            text=True,
-            timeout=5
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
         )
-        if result.returncode == 0:
-            # Parse version from output like "wine-9.0" or "wine-8.0.1 (Staging)"
-            version_match = re.search(r'wine[- ](\d+\.\d+(?:\.\d+)?)', result.stdout)
-            if version_match:
-                return version_match.group(1)
-            return result.stdout.strip()
+    except OSError:
+        return 'Unknown'
+
+    try:
+        ready, _, _ = select.select([process.stdout], [], [], 5)
+        line = process.stdout.readline().strip() if ready else ''
     except Exception:
-        pass
+        line = ''
+    finally:
+        process.kill()
+        process.wait()
+        process.stdout.close()
+
+    if line:
+        # Parse version from output like "wine-9.0" or "wine-8.0.1 (Staging)"
+        version_match = _WINE_VERSION_RE.search(line)
+        if version_match:
+            return version_match.group(1)
+        return line
     return 'Unknown'
 
 
@@ -166,16 +289,21 @@ def check_wine_dependencies() -> Dict[str, bool]:
     Returns:
         Dict with dependency names as keys and availability as values.
     """
-    dependencies = {
-        'wine': False,
-        'winetricks': False,
-        'cabextract': False,
-    }
+    key = _dirs_cache_key(_path_dirs())
+    cached = _DEPENDENCY_CACHE.get(key)
+    if cached is None:
+        cached = {
+            'wine': False,
+            'winetricks': False,
+            'cabextract': False,
+        }
+
+        for dep in cached:
+            cached[dep] = _which(dep) is not None
 
-    for dep in dependencies:
-        dependencies[dep] = _which(dep) is not None
+        _DEPENDENCY_CACHE[key] = cached
 
-    return dependencies
+    return dict(cached)
 
 
 def get_wine_prefix_info(prefix_path: str) -> Dict[str, any]:
@@ -202,9 +330,10 @@ def get_wine_prefix_info(prefix_path: str) -> Dict[str, any]:
     system_reg = os.path.join(prefix_path, 'system.reg')
     if os.path.isfile(system_reg):
         try:
-            with open(system_reg, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(1024)  # Read first 1KB
-                if 'win64' in content.lower() or 'amd64' in content.lower():
+            # The markers are ASCII, so search the raw bytes without decoding
+            with open(system_reg, 'rb') as f:
+                content = f.read(1024).lower()  # Read first 1KB
+                if b'win64' in content or b'amd64' in content:
                     info['arch'] = 'win64'
                 else:
                     info['arch'] = 'win32'
@@ -213,19 +342,147 @@ def get_wine_prefix_info(prefix_path: str) -> Dict[str, any]:
 
     # Get prefix size
     try:
-        total_size = 0
-        for dirpath, dirnames, filenames in os.walk(prefix_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
+        info['size'] = _parallel_walk_size(prefix_path)
+    except Exception:
+        pass
+
+    return info
+
+
+def _parallel_walk_size(path: str, max_workers: int = 4, split_depth: int = 2) -> int:
+    """
+    Total the size of all files below a directory, walking subdirectories
+    concurrently.
+
+    The first split_depth levels are scanned inline so the work splits
+    below drive_c (windows, Program Files, users, ...) rather than on the
+    prefix's few top-level entries. A few workers overlap the stat calls;
+    more than that mostly contend on the same filesystem.
+    """
+    # On network mounts read sizes without forcing attribute sync
+    size_of = _statx_size if _is_network_fs(path) and _load_statx() else _entry_size
+
+    total = 0
+    subdirs = [path]
+    for _ in range(split_depth):
+        frontier, subdirs = subdirs, []
+        for directory in frontier:
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                if not entry.is_symlink():
+                                    subdirs.append(entry.path)
+                            else:
+                                total += size_of(entry)
+                        except OSError:
+                            pass
+            except OSError:
+                pass
+
+    if subdirs:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(subdirs))) as executor:
+            total += sum(executor.map(partial(_walk_size, size_of=size_of), subdirs))
+    return total
+
+
+def _walk_size(path: str, size_of=None) -> int:
+    """
+    Total the size of all files below a directory.
+
+    Uses os.scandir so directory entries carry their type from the
+    directory read. Like os.walk, symlinked directories (the prefix's
+    dosdevices) are not descended into; symlinked files count the target.
+    size_of maps a file's DirEntry to its size (default: DirEntry.stat()).
+    """
+    if size_of is None:
+        size_of = _entry_size
+
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
                 try:
-                    total_size += os.path.getsize(filepath)
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            total += _walk_size(entry.path, size_of)
+                    else:
+                        total += size_of(entry)
                 except OSError:
                     pass
-        info['size'] = total_size
-    except Exception:
+    except OSError:
         pass
+    return total
 
-    return info
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """Get a file's size from its directory entry."""
+    return entry.stat().st_size
+
+
+def _is_network_fs(path: str) -> bool:
+    """Check whether path lives on a network filesystem (NFS, SMB, sshfs...)."""
+    path = os.path.realpath(path)
+    best_mount, best_type = '', ''
+    try:
+        with open('/proc/self/mounts', 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+                # Mount points escape spaces and other specials as octal
+                mount = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), fields[1])
+                if (path == mount or path.startswith(mount.rstrip('/') + '/')) \
+                        and len(mount) > len(best_mount):
+                    best_mount, best_type = mount, fields[2]
+    except OSError:
+        return False
+    return best_type in _NETWORK_FS_TYPES
+
+
+@cache
+def _load_statx():
+    """Load glibc's statx() via ctypes, or None if unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+
+        class Statx(ctypes.Structure):
+            # Leading fields of struct statx, padded to its full 256 bytes
+            _fields_ = [
+                ('stx_mask', ctypes.c_uint32),
+                ('stx_blksize', ctypes.c_uint32),
+                ('stx_attributes', ctypes.c_uint64),
+                ('stx_nlink', ctypes.c_uint32),
+                ('stx_uid', ctypes.c_uint32),
+                ('stx_gid', ctypes.c_uint32),
+                ('stx_mode', ctypes.c_uint16),
+                ('spare0', ctypes.c_uint16),
+                ('stx_ino', ctypes.c_uint64),
+                ('stx_size', ctypes.c_uint64),
+                ('rest', ctypes.c_uint8 * 208),
+            ]
+
+        statx = ctypes.CDLL(None, use_errno=True).statx
+        statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                          ctypes.c_uint, ctypes.POINTER(Statx)]
+        statx.restype = ctypes.c_int
+        return statx, Statx
+    except (ImportError, OSError, AttributeError):
+        return None
+
+
+def _statx_size(entry: os.DirEntry) -> int:
+    """Get a file's size with statx(AT_STATX_DONT_SYNC), using cached attributes."""
+    statx, Statx = _load_statx()
+    buf = Statx()
+    if statx(_AT_FDCWD, os.fsencode(entry.path), _AT_STATX_DONT_SYNC,
+             _STATX_SIZE, buf) == 0:
+        return buf.stx_size
+    # ENOSYS and friends: let a regular stat decide (and raise if missing)
+    return entry.stat().st_size
 
 
 def create_wine_prefix(wine_path: str, prefix_path: str, arch: str = 'win64') -> Tuple[bool, str]:
@@ -274,26 +531,36 @@ def _detect_audio_driver() -> str:
     Returns:
         Audio driver name ('pulse' for PulseAudio, 'alsa' for ALSA, or '' for auto).
     """
-    # Check if PulseAudio is running
-    try:
-        result = subprocess.run(['pactl', 'info'], capture_output=True, timeout=1)
-        if result.returncode == 0:
-            return 'pulse'
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-
-    # Check if PipeWire is running (uses pulseaudio compatibility)
-    try:
-        result = subprocess.run(['pw-cli', 'info'], capture_output=True, timeout=1)
-        if result.returncode == 0:
-            return 'pulse'  # PipeWire supports PulseAudio protocol
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    # An explicitly configured (possibly remote) PulseAudio server
+    if os.environ.get('PULSE_SERVER'):
+        return 'pulse'
+
+    # Check for a PulseAudio or PipeWire server socket instead of running
+    # pactl / pw-cli (PipeWire supports the PulseAudio protocol). Not cached:
+    # the sound server may start after WineTranslator does.
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR', f'/run/user/{os.getuid()}')
+    if (os.path.exists(os.path.join(runtime_dir, 'pulse', 'native'))
+            or os.path.exists(os.path.join(runtime_dir, 'pipewire-0'))):
+        return 'pulse'
 
     # Default to ALSA
     return 'alsa'
 
 
+def _app_log_path(app_name: Optional[str]) -> str:
+    """Get the log file path for an app, sanitizing each name only once."""
+    log_file = _LOG_PATH_CACHE.get(app_name)
+    if log_file is None:
+        if app_name:
+            # Sanitize app name for filename
+            safe_name = "".join(c for c in app_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            log_file = os.path.join(APP_LOG_DIR, f"{safe_name}.log")
+        else:
+            log_file = os.path.join(APP_LOG_DIR, 'unknown_app.log')
+        _LOG_PATH_CACHE[app_name] = log_file
+    return log_file
+
+
 def launch_wine_application(wine_path: str, prefix_path: str, exe_path: str,
                            args: List[str] = None, working_dir: str = None,
                            env_vars: Dict[str, str] = None, app_name: str = None) -> subprocess.Popen:
@@ -315,25 +582,27 @@ def launch_wine_application(wine_path: str, prefix_path: str, exe_path: str,
     import logging
     logger = logging.getLogger(__name__)
 
-    env = os.environ.copy()
-    env['WINEPREFIX'] = prefix_path
-
     # Set audio driver (auto-detect PulseAudio/ALSA)
     audio_driver = _detect_audio_driver()
-    env['WINEAUDIODRIVER'] = audio_driver
     logger.info(f"Using audio driver: {audio_driver}")
 
     # Set DirectSound to use native Wine implementation
     # This helps with audio compatibility in games
-    if 'WINEDLLOVERRIDES' in env:
+    dll_overrides = os.environ.get('WINEDLLOVERRIDES')
+    if dll_overrides:
         # Append to existing overrides
-        env['WINEDLLOVERRIDES'] = f"{env['WINEDLLOVERRIDES']};dsound=n,b"
+        dll_overrides = f"{dll_overrides};dsound=n,b"
     else:
-        env['WINEDLLOVERRIDES'] = 'dsound=n,b'
-
-    # Add custom environment variables
-    if env_vars:
-        env.update(env_vars)
+        dll_overrides = 'dsound=n,b'
+
+    # Build the child environment in one merge; custom environment
+    # variables are applied last so they can override ours
+    env = os.environ | {
+        'WINEPREFIX': prefix_path,
+        'WINEAUDIODRIVER': audio_driver,
+        'WINEDLLOVERRIDES': dll_overrides,
+        **(env_vars or {}),
+    }
 
     # Check for virtual desktop configuration
     # This prevents fullscreen games from taking over the entire screen
@@ -353,15 +622,8 @@ def launch_wine_application(wine_path: str, prefix_path: str, exe_path: str,
         cmd.extend(args)
 
     # Create app-specific log file
-    log_dir = os.path.join(os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share')), 'winetranslator', 'app_logs')
-    os.makedirs(log_dir, exist_ok=True)
-
-    if app_name:
-        # Sanitize app name for filename
-        safe_name = "".join(c for c in app_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        log_file = os.path.join(log_dir, f"{safe_name}.log")
-    else:
-        log_file = os.path.join(log_dir, 'unknown_app.log')
+    os.makedirs(APP_LOG_DIR, exist_ok=True)
+    log_file = _app_log_path(app_name)
 
     logger.info(f"Launching app: {app_name or exe_path}")
     logger.info(f"Command: {' '.join(cmd)}")
@@ -369,24 +631,27 @@ def launch_wine_application(wine_path: str, prefix_path: str, exe_path: str,
 
     # Launch application with output redirected to log file
     try:
-        log_handle = open(log_file, 'a')
-        log_handle.write(f"\n{'='*60}\n")
-        log_handle.write(f"Launch: {app_name or exe_path}\n")
-        log_handle.write(f"Time: {subprocess.run(['date'], capture_output=True, text=True).stdout.strip()}\n")
-        log_handle.write(f"Command: {' '.join(cmd)}\n")
-        log_handle.write(f"{'='*60}\n\n")
-        log_handle.flush()
-
-        process = subprocess.Popen(
-            cmd,
-            env=env,
-            cwd=working_dir,
-            stdout=log_handle,
-            stderr=subprocess.STDOUT  # Combine stderr with stdout
+        header = (
+            f"\n{'='*60}\n"
+            f"Launch: {app_name or exe_path}\n"
+            f"Time: {datetime.now().isoformat(timespec='seconds')}\n"
+            f"Command: {' '.join(cmd)}\n"
+            f"{'='*60}\n\n"
         )
-
-        # Store log handle on process object so it can be closed later
-        process._log_handle = log_handle
+        log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(log_fd, header.encode())
+
+            process = subprocess.Popen(
+                cmd,
+                env=env,
+                cwd=working_dir,
+                stdout=log_fd,
+                stderr=subprocess.STDOUT  # Combine stderr with stdout
+            )
+        finally:
+            # The child has its own copy of the descriptor
+            os.close(log_fd)
 
     except Exception as e:
         logger.error(f"Failed to launch {app_name or exe_path}: {str(e)}")